@@ -10,7 +10,22 @@ For system TTS fallback support, see reader-small package.
 __version__ = "0.4.1"
 __author__ = "danielcorsano"
 
-# Public API
-from .api import Reader, convert, list_voices
+__all__ = ["Reader", "convert", "list_voices"]
 
-__all__ = ["Reader", "convert", "list_voices"]
\ No newline at end of file
+
+def __getattr__(name):
+    """Import the public API on first access (PEP 562).
+
+    Keeps ``import reader`` and ``reader --help`` from loading the TTS
+    engine stack until the API is actually used.
+    """
+    if name in __all__:
+        from . import api
+        value = getattr(api, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,6 @@
 """Dialogue detection and context analysis for Phase 3."""
 import re
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import dataclass
 
@@ -38,7 +39,20 @@ class DialogueDetector:
         'description': ['was', 'were', 'had', 'looked', 'appeared', 'seemed', 'beautiful', 'dark'],
         'emotion': ['angry', 'happy', 'sad', 'excited', 'nervous', 'calm', 'frustrated', 'joyful']
     }
+
+    # Emotion indicators (checked in priority order)
+    EMOTION_KEYWORDS = {
+        'anger': ('angry', 'furious', 'rage', 'mad', 'annoyed', 'irritated'),
+        'joy': ('happy', 'joyful', 'excited', 'delighted', 'cheerful', 'glad'),
+        'sadness': ('sad', 'sorrowful', 'depressed', 'melancholy', 'grief', 'mourning'),
+        'fear': ('afraid', 'scared', 'terrified', 'anxious', 'worried', 'nervous'),
+        'surprise': ('surprised', 'shocked', 'astonished', 'amazed', 'stunned'),
+        'disgust': ('disgusted', 'revolted', 'repulsed', 'sick', 'nauseated')
+    }
     
+    # Every dialogue pattern needs one of these characters to match
+    _DIALOGUE_MARKER = re.compile(r'["\'—]')
+
     # Speaker attribution patterns
     SPEAKER_PATTERNS = [
         r'(\w+)\s+(?:said|asked|replied|whispered|shouted|exclaimed)',
@@ -49,8 +63,9 @@ class DialogueDetector:
     
     def __init__(self):
         """Initialize the dialogue detector."""
+        # dict.fromkeys drops duplicate patterns while keeping their order
         self.compiled_dialogue_patterns = [re.compile(pattern, re.IGNORECASE) 
-                                         for pattern in self.DIALOGUE_PATTERNS]
+                                         for pattern in dict.fromkeys(self.DIALOGUE_PATTERNS)]
         self.compiled_speaker_patterns = [re.compile(pattern, re.IGNORECASE) 
                                         for pattern in self.SPEAKER_PATTERNS]
     
@@ -93,6 +108,10 @@ class DialogueDetector:
     
     def _find_dialogue(self, text: str) -> List[Tuple[str, int, int]]:
         """Find all dialogue matches in text with their positions."""
+        # Cheap C-level pre-check: no quote or dash means no pattern can match
+        if not self._DIALOGUE_MARKER.search(text):
+            return []
+
         matches = []
         
         for pattern in self.compiled_dialogue_patterns:
@@ -173,52 +192,11 @@ class DialogueDetector:
     
     def _classify_narrative(self, text: str) -> str:
         """Classify narrative text type based on keywords."""
-        text_lower = text.lower()
-        
-        # Count keyword matches for each category
-        category_scores = {}
-        for category, keywords in self.CONTEXT_KEYWORDS.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            if score > 0:
-                category_scores[category] = score
-        
-        if not category_scores:
-            return "description"
-        
-        # Return category with highest score
-        return max(category_scores, key=category_scores.get)
+        return _classify_narrative(text)
     
     def _detect_emotion_context(self, text: str) -> str:
         """Detect emotional context from text."""
-        text_lower = text.lower()
-        
-        # Emotion indicators
-        emotion_patterns = {
-            'anger': ['angry', 'furious', 'rage', 'mad', 'annoyed', 'irritated'],
-            'joy': ['happy', 'joyful', 'excited', 'delighted', 'cheerful', 'glad'],
-            'sadness': ['sad', 'sorrowful', 'depressed', 'melancholy', 'grief', 'mourning'],
-            'fear': ['afraid', 'scared', 'terrified', 'anxious', 'worried', 'nervous'],
-            'surprise': ['surprised', 'shocked', 'astonished', 'amazed', 'stunned'],
-            'disgust': ['disgusted', 'revolted', 'repulsed', 'sick', 'nauseated']
-        }
-        
-        # Punctuation indicators
-        if '!' in text:
-            if any(word in text_lower for word in ['no', 'stop', 'dont', "don't"]):
-                return 'anger'
-            else:
-                return 'excitement'
-        elif '?' in text:
-            return 'curiosity'
-        elif '...' in text:
-            return 'hesitation'
-        
-        # Check emotion keywords
-        for emotion, keywords in emotion_patterns.items():
-            if any(keyword in text_lower for keyword in keywords):
-                return emotion
-        
-        return 'neutral'
+        return _detect_emotion_context(text)
     
     def get_dialogue_ratio(self, segments: List[TextSegment]) -> float:
         """Calculate the ratio of dialogue to total text."""
@@ -251,14 +229,62 @@ class DialogueDetector:
         emotions = {}
         for segment in segments:
             emotions[segment.emotion_context] = emotions.get(segment.emotion_context, 0) + 1
+
+        speakers = self.get_speaker_list(segments)
         
         return {
             'total_segments': total_segments,
             'dialogue_segments': dialogue_segments,
             'narrative_segments': narrative_segments,
             'dialogue_ratio': self.get_dialogue_ratio(segments),
-            'unique_speakers': len(self.get_speaker_list(segments)),
-            'speakers': self.get_speaker_list(segments),
+            'unique_speakers': len(speakers),
+            'speakers': speakers,
             'narrative_types': narrative_types,
             'emotion_contexts': emotions
-        }
\ No newline at end of file
+        }
+
+
+# Context helpers are pure in their text argument and short lines ("Yes.",
+# "No.", names) repeat often, so memoize them once per process
+
+@lru_cache(maxsize=4096)
+def _classify_narrative(text: str) -> str:
+    """Classify narrative text type based on keywords."""
+    text_lower = text.lower()
+    
+    # Count keyword matches for each category
+    category_scores = {}
+    for category, keywords in DialogueDetector.CONTEXT_KEYWORDS.items():
+        score = sum(1 for keyword in keywords if keyword in text_lower)
+        if score > 0:
+            category_scores[category] = score
+    
+    if not category_scores:
+        return "description"
+    
+    # Return category with highest score
+    return max(category_scores, key=category_scores.get)
+
+
+@lru_cache(maxsize=4096)
+def _detect_emotion_context(text: str) -> str:
+    """Detect emotional context from text."""
+    text_lower = text.lower()
+    
+    # Punctuation indicators
+    if '!' in text:
+        if any(word in text_lower for word in ['no', 'stop', 'dont', "don't"]):
+            return 'anger'
+        else:
+            return 'excitement'
+    elif '?' in text:
+        return 'curiosity'
+    elif '...' in text:
+        return 'hesitation'
+    
+    # Check emotion keywords in priority order, stopping at the first hit
+    for emotion, keywords in DialogueDetector.EMOTION_KEYWORDS.items():
+        if any(keyword in text_lower for keyword in keywords):
+            return emotion
+    
+    return 'neutral'
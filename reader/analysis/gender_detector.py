@@ -74,18 +74,26 @@ class GenderDetector:
         """
         results = {}
 
+        # One alternation over every name (longest first) so each character
+        # needs a single pass over the text instead of one pass per other name
+        names = sorted({n for n in character_names if n}, key=len, reverse=True)
+        names_pattern = None
+        if len(names) > 1:
+            names_pattern = re.compile(
+                r'\b(?:' + '|'.join(map(re.escape, names)) + r')\b',
+                re.IGNORECASE
+            )
+
         for name in character_names:
             # Create filtered text without other character names to reduce noise
             filtered_text = text
-            for other_name in character_names:
-                if other_name != name:
-                    # Replace other character names with placeholder to avoid confusion
-                    filtered_text = re.sub(
-                        r'\b' + re.escape(other_name) + r'\b',
-                        'PERSON',
-                        filtered_text,
-                        flags=re.IGNORECASE
-                    )
+            if names_pattern is not None:
+                target = name.lower()
+                # Replace other character names with placeholder to avoid confusion
+                filtered_text = names_pattern.sub(
+                    lambda m: m.group(0) if m.group(0).lower() == target else 'PERSON',
+                    text
+                )
 
             results[name] = self.detect_character_gender(name, filtered_text)
 
@@ -1,11 +1,18 @@
 """Neural Engine optimized processor with streaming and checkpoint support."""
 import gc
+import importlib
 import json
+import os
 import time
 import hashlib
 import wave
 import io
 import struct
+import queue
+import shutil
+import subprocess
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any
 from dataclasses import dataclass, asdict
@@ -14,12 +21,32 @@ from abc import ABC, abstractmethod
 # Text processing utilities
 from ..text_processing.number_expander import get_number_expander
 from ..text_processing.phonemizer import get_phonemizer
+from ..utils.setup import get_ffmpeg_path
 
 # Constants
 DEFAULT_SAMPLE_RATE = 24000  # Kokoro v1.0 native sample rate
 SILENCE_DURATION = 0.1
 DEFAULT_CHECKPOINT_INTERVAL = 25
 CROSSFADE_SAMPLES = 480  # 20ms at 24000 Hz for smooth chunk transitions
+FINGERPRINT_SAMPLE_BYTES = 64 * 1024  # Bytes read at head, middle and tail of the source
+
+# Engine errors no amount of text splitting can fix (unknown voice, model not loaded)
+FATAL_SYNTHESIS_ERRORS = (
+    "not found. Available voices",
+    "Failed to initialize Kokoro",
+    "Kokoro initialization failed",
+    "Kokoro engine not initialized",
+)
+
+# Unicode punctuation the TTS front end mishandles, mapped to ASCII
+PUNCTUATION_TABLE = str.maketrans({
+    '\u00a0': ' ',  # Non-breaking space
+    '\u2013': '-',  # En dash
+    '\u2014': '-',  # Em dash
+    '\u2019': "'",  # Right single quote
+    '\u201c': '"',  # Left double quote
+    '\u201d': '"',  # Right double quote
+})
 
 
 @dataclass
@@ -31,6 +58,9 @@ class NeuralCheckpoint:
     output_size: int
     settings_hash: str
     timestamp: float
+    file_hash: str = ''  # Source fingerprint; empty in checkpoints from older versions
+    file_size: int = 0  # Source stat at save time, lets resume skip re-fingerprinting
+    file_mtime_ns: int = 0
 
 
 class ProgressDisplay(ABC):
@@ -55,14 +85,23 @@ class ProgressDisplay(ABC):
 class SimpleProgressDisplay(ProgressDisplay):
     """Simple text-based progress display (current default)."""
     
+    # At most one line per interval (seconds); the final chunk always prints
+    MIN_UPDATE_INTERVAL = 0.1
+    
     def __init__(self):
         self.start_time = None
+        self._last_emit = float('-inf')
     
     def start(self, total_chunks: int, file_name: str):
         self.start_time = time.time()
         print(f"🎯 Neural Engine stream processing {file_name} ({total_chunks} chunks, 24k mono MP3)")
     
     def update(self, current_chunk: int, total_chunks: int, elapsed_time: float, eta_seconds: float):
+        now = time.monotonic()
+        if now - self._last_emit < self.MIN_UPDATE_INTERVAL and current_chunk != total_chunks:
+            return
+        self._last_emit = now
+        
         progress = (current_chunk / total_chunks) * 100
         
         if current_chunk > 1:  # Show ETA after first chunk
@@ -78,35 +117,38 @@ class SimpleProgressDisplay(ProgressDisplay):
         pass
 
 
+# Optional progress displays: style -> (module, class, library named in the
+# fallback warning, whether the class takes a debug flag)
+PROGRESS_DISPLAYS = {
+    'tqdm': ('.tqdm_progress', 'TQDMProgressDisplay', 'TQDM', False),
+    'rich': ('.rich_progress', 'RichProgressDisplay', 'Rich', False),
+    'timeseries': ('.timeseries_progress', 'TimeseriesProgressDisplay', 'Plotext', True),
+}
+
+
+@lru_cache(maxsize=None)
+def _get_display_cls(style: str) -> type:
+    """Import a progress display class on first use (raises ImportError if unavailable)."""
+    module_name, class_name, _, _ = PROGRESS_DISPLAYS[style]
+    return getattr(importlib.import_module(module_name, __package__), class_name)
+
+
 def create_progress_display(style: str, debug: bool = False) -> ProgressDisplay:
     """Factory function to create progress display instances."""
     if style == "simple":
         return SimpleProgressDisplay()
-    elif style == "tqdm":
-        try:
-            from .tqdm_progress import TQDMProgressDisplay
-            return TQDMProgressDisplay()
-        except ImportError:
-            print("⚠️ TQDM not available, falling back to simple display")
-            return SimpleProgressDisplay()
-    elif style == "rich":
-        try:
-            from .rich_progress import RichProgressDisplay
-            return RichProgressDisplay()
-        except ImportError:
-            print("⚠️ Rich not available, falling back to simple display")
-            return SimpleProgressDisplay()
-    elif style == "timeseries":
-        try:
-            from .timeseries_progress import TimeseriesProgressDisplay
-            return TimeseriesProgressDisplay(debug=debug)
-        except ImportError:
-            print("⚠️ Plotext not available, falling back to simple display")
-            return SimpleProgressDisplay()
-    else:
+    if style not in PROGRESS_DISPLAYS:
         print(f"⚠️ Unknown progress style '{style}', using simple display")
         return SimpleProgressDisplay()
 
+    _, _, library, takes_debug = PROGRESS_DISPLAYS[style]
+    try:
+        display_cls = _get_display_cls(style)
+    except ImportError:
+        print(f"⚠️ {library} not available, falling back to simple display")
+        return SimpleProgressDisplay()
+    return display_cls(debug=debug) if takes_debug else display_cls()
+
 
 class NeuralProcessor:
     """Neural Engine optimized processor with streaming output and checkpoints."""
@@ -128,7 +170,6 @@ class NeuralProcessor:
             self.debug_log.parent.mkdir(parents=True, exist_ok=True)
             self.debug_log.unlink(missing_ok=True)
             with open(self.debug_log, 'w') as f:
-                import os
                 f.write(f"=== NeuralProcessor.__init__ at {time.time()} (PID {os.getpid()}) ===\n")
                 f.write(f"Progress display: {type(self.progress_display).__name__}\n")
 
@@ -146,8 +187,17 @@ class NeuralProcessor:
         self.is_mp3_output = output_path.suffix.lower() == '.mp3'
         self.temp_wav_path = output_path.with_suffix('.wav.tmp') if self.is_mp3_output else None
 
-        # Time-based checkpointing (track last checkpoint time)
-        self.last_checkpoint_time = 0
+        # Fingerprint and (size, mtime_ns) of the source being converted
+        # (set per process_chunks call)
+        self.file_hash = ''
+        self.file_stat = (0, 0)
+
+        # Background checkpoint writer (running only inside process_chunks)
+        self._checkpoint_queue = None
+        self._checkpoint_thread = None
+
+        # Time-based checkpointing (track last checkpoint time, time.monotonic())
+        self.last_checkpoint_time = float('-inf')
         self.checkpoint_interval_seconds = 60  # Save checkpoint every 60 seconds
 
         # Number expansion for TTS (singleton instance)
@@ -163,6 +213,8 @@ class NeuralProcessor:
         """Process chunks with Neural Engine optimization and stream to output."""
         total_chunks = len(text_chunks)
         settings_hash = self._get_settings_hash(processing_config)
+        self.file_stat = self._get_file_stat(file_path)
+        self.file_hash = ''
 
         # Check for lock file (another process working on this file)
         lock_path = self.output_path.with_suffix('.lock')
@@ -174,7 +226,6 @@ class NeuralProcessor:
         # Create lock file
         try:
             with open(lock_path, 'w') as f:
-                import os
                 f.write(f"{os.getpid()}\n")
         except Exception as e:
             print(f"⚠️ Could not create lock file: {e}")
@@ -182,6 +233,9 @@ class NeuralProcessor:
         try:
             # Check for existing checkpoint
             start_chunk, output_size = self._load_checkpoint(file_path, total_chunks, settings_hash)
+            if not self.file_hash:
+                self.file_hash = self._get_file_hash(file_path)
+            self._start_checkpoint_writer()
 
             # Initialize progress display
             self.progress_display.start(total_chunks, file_path.name)
@@ -204,22 +258,26 @@ class NeuralProcessor:
                     output_file.write(self._prev_tail)
                     self._prev_tail = None
 
-                # Convert temp WAV to MP3 if needed
-                if self.is_mp3_output:
-                    self._convert_wav_to_mp3()
+            # Output is closed (fully flushed) before FFmpeg reads the temp file
+            if self.is_mp3_output:
+                self._convert_wav_to_mp3()
 
-                # Clean up checkpoint on completion
-                self._cleanup_checkpoint()
+            # Clean up checkpoint on completion (after any pending write lands)
+            self._stop_checkpoint_writer()
+            self._cleanup_checkpoint()
 
-                # Finalize progress display
-                self.progress_display.finish()
+            # Finalize progress display
+            self.progress_display.finish()
 
-                # Move finished file to finished folder
-                finished_path = self._move_to_finished()
+            # Move finished file to finished folder
+            finished_path = self._move_to_finished()
 
-                print(f"✅ Neural Engine processing complete: {finished_path}")
-                return finished_path
+            print(f"✅ Neural Engine processing complete: {finished_path}")
+            return finished_path
         finally:
+            # Let a pending checkpoint finish so an interrupted run can resume
+            self._stop_checkpoint_writer()
+
             # Always remove lock file, even on error
             if lock_path.exists():
                 lock_path.unlink()
@@ -229,8 +287,10 @@ class NeuralProcessor:
                            start_chunk: int, total_chunks: int,
                            file_path: Path, settings_hash: str):
         """Sequential chunk processing optimized for Neural Engine."""
-        start_time = time.time()
+        # Monotonic clock: ETA and checkpoint timing are immune to wall-clock jumps
+        start_time = time.monotonic()
         neural_engine_confirmed = False
+        update_progress = self.progress_display.update
 
         if self.debug:
             with open(self.debug_log, 'a') as f:
@@ -243,7 +303,7 @@ class NeuralProcessor:
             
             # Calculate progress and ETA for progress display
             if i > start_chunk:  # Calculate ETA after first chunk
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 chunks_done = i + 1 - start_chunk
                 chunks_remaining = total_chunks - (i + 1)
                 eta_seconds = (elapsed / chunks_done) * chunks_remaining
@@ -252,7 +312,7 @@ class NeuralProcessor:
                 eta_seconds = 0
             
             # Update progress display
-            self.progress_display.update(i + 1, total_chunks, elapsed, eta_seconds)
+            update_progress(i + 1, total_chunks, elapsed, eta_seconds)
             
             # Process chunk with Neural Engine
             try:
@@ -268,52 +328,13 @@ class NeuralProcessor:
             except Exception as e:
                 error_str = str(e)
 
+                # Retrying smaller pieces would fail the same way, once per sentence
+                if any(marker in error_str for marker in FATAL_SYNTHESIS_ERRORS):
+                    raise
+
                 # Check if this is the Kokoro phoneme limit bug (510 phonemes)
                 if "510" in error_str and "out of bounds" in error_str:
                     print(f"\n⚠️  Chunk {i+1} exceeds phoneme limit - splitting into smaller pieces", flush=True)
-
-                    # Split chunk into smaller pieces and process each
-                    # Find sentence boundaries for clean splits
-                    sentences = []
-                    current = []
-                    for char in chunk_text:
-                        current.append(char)
-                        if char in '.!?':
-                            sentences.append(''.join(current).strip())
-                            current = []
-                    if current:
-                        sentences.append(''.join(current).strip())
-
-                    # Process each sentence separately
-                    audio_parts = []
-                    for j, sentence in enumerate(sentences):
-                        if not sentence.strip():
-                            continue
-                        try:
-                            audio_part = self._process_single_chunk(sentence, i, total_chunks, tts_engine, voice_blend, speed)
-                            # Strip WAV header from all but first part
-                            if j > 0:
-                                audio_part = self._extract_pcm_frames(audio_part)
-                            audio_parts.append(audio_part)
-                        except Exception as sent_error:
-                            # If even a single sentence fails, split at word boundary
-                            s1, s2 = self._split_at_word_boundary(sentence)
-                            try:
-                                part1 = self._process_single_chunk(s1, i, total_chunks, tts_engine, voice_blend, speed)
-                                part2 = self._process_single_chunk(s2, i, total_chunks, tts_engine, voice_blend, speed)
-                                audio_parts.append(part1)
-                                audio_parts.append(self._extract_pcm_frames(part2))
-                            except Exception as final_error:
-                                print(f"⚠️  Cannot synthesize part of chunk {i+1}, skipping this segment", flush=True)
-                                continue
-
-                    if not audio_parts:
-                        skipped_chunks.append(i + 1)
-                        print(f"\n⚠️  Warning: Skipping chunk {i+1} entirely - no segments could be synthesized", flush=True)
-                        continue
-
-                    audio_data = b''.join(audio_parts)
-                    print(f"✅ Successfully processed chunk {i+1} in {len(sentences)} pieces", flush=True)
                 else:
                     # Other synthesis errors — try splitting before giving up
                     print(f"\n⚠️  Chunk {i+1} synthesis error ({error_str[:80]}) - splitting and retrying", flush=True)
@@ -324,49 +345,23 @@ class NeuralProcessor:
                             f.write(f"{e}\nLength: {len(chunk_text)}\n")
                             f.write(traceback.format_exc())
 
-                    sentences = []
-                    current = []
-                    for char in chunk_text:
-                        current.append(char)
-                        if char in '.!?':
-                            sentences.append(''.join(current).strip())
-                            current = []
-                    if current:
-                        sentences.append(''.join(current).strip())
-
-                    audio_parts = []
-                    for j, sentence in enumerate(sentences):
-                        if not sentence.strip():
-                            continue
-                        try:
-                            audio_part = self._process_single_chunk(sentence, i, total_chunks, tts_engine, voice_blend, speed)
-                            if j > 0:
-                                audio_part = self._extract_pcm_frames(audio_part)
-                            audio_parts.append(audio_part)
-                        except Exception:
-                            s1, s2 = self._split_at_word_boundary(sentence)
-                            try:
-                                part1 = self._process_single_chunk(s1, i, total_chunks, tts_engine, voice_blend, speed)
-                                part2 = self._process_single_chunk(s2, i, total_chunks, tts_engine, voice_blend, speed)
-                                audio_parts.append(part1)
-                                audio_parts.append(self._extract_pcm_frames(part2))
-                            except Exception:
-                                print(f"⚠️  Cannot synthesize part of chunk {i+1}, skipping segment", flush=True)
-                                continue
-
-                    if not audio_parts:
-                        skipped_chunks.append(i + 1)
-                        print(f"\n⚠️  Warning: Skipping chunk {i+1} entirely - no segments could be synthesized", flush=True)
-                        continue
-
-                    audio_data = b''.join(audio_parts)
-                    print(f"✅ Successfully processed chunk {i+1} in {len(sentences)} pieces", flush=True)
-            
-            # Convert and write immediately for streaming
-            self._convert_and_write_chunk(output_file, audio_data)
+                frames, piece_count = self._synthesize_in_pieces(
+                    chunk_text, i, total_chunks, tts_engine, voice_blend, speed
+                )
+                if frames is None:
+                    skipped_chunks.append(i + 1)
+                    print(f"\n⚠️  Warning: Skipping chunk {i+1} entirely - no segments could be synthesized", flush=True)
+                    continue
+
+                print(f"✅ Successfully processed chunk {i+1} in {piece_count} pieces", flush=True)
+            else:
+                frames = self._extract_pcm_frames(audio_data)
+
+            # Write raw PCM immediately for streaming
+            self._write_chunk_frames(output_file, frames)
 
             # Save checkpoint periodically (time-based with chunk-based fallback)
-            current_time = time.time()
+            current_time = time.monotonic()
             time_since_last_checkpoint = current_time - self.last_checkpoint_time
 
             # Checkpoint if either: 60 seconds passed OR chunk interval reached
@@ -385,6 +380,76 @@ class NeuralProcessor:
         if skipped_chunks:
             print(f"\n⚠️  Completed with {len(skipped_chunks)} skipped chunk(s): {', '.join(map(str, skipped_chunks))}")
     
+    def _synthesize_in_pieces(self, chunk_text: str, chunk_idx: int, total_chunks: int,
+                              tts_engine, voice_blend: Dict[str, float], speed: float) -> tuple:
+        """Retry a failed chunk sentence by sentence, halving sentences that still fail.
+
+        Returns (pcm_bytes, piece_count); pcm_bytes is None if nothing could be
+        synthesized. Pieces are joined as raw PCM and handed straight to the
+        write path, so no WAV header is built only to be parsed again.
+        """
+        # Find sentence boundaries for clean splits
+        sentences = []
+        current = []
+        for char in chunk_text:
+            current.append(char)
+            if char in '.!?':
+                sentences.append(''.join(current).strip())
+                current = []
+        if current:
+            sentences.append(''.join(current).strip())
+
+        pcm_parts = []
+        for sentence in sentences:
+            if not sentence.strip():
+                continue
+            try:
+                audio_part = self._process_single_chunk(sentence, chunk_idx, total_chunks, tts_engine, voice_blend, speed)
+                pcm_parts.append(self._extract_pcm_frames(audio_part))
+            except Exception:
+                # If even a single sentence fails, split at word boundary
+                s1, s2 = self._split_at_word_boundary(sentence)
+                try:
+                    part1 = self._process_single_chunk(s1, chunk_idx, total_chunks, tts_engine, voice_blend, speed)
+                    part2 = self._process_single_chunk(s2, chunk_idx, total_chunks, tts_engine, voice_blend, speed)
+                    pcm_parts.append(self._extract_pcm_frames(part1))
+                    pcm_parts.append(self._extract_pcm_frames(part2))
+                except Exception:
+                    print(f"⚠️  Cannot synthesize part of chunk {chunk_idx+1}, skipping segment", flush=True)
+                    continue
+
+        if not pcm_parts:
+            return None, len(sentences)
+
+        return b''.join(pcm_parts), len(sentences)
+
+    @staticmethod
+    def _pcm_to_wav(pcm_data: bytes, sample_rate: int = DEFAULT_SAMPLE_RATE) -> bytes:
+        """Wrap 16-bit mono PCM in a WAV header."""
+        wav_buffer = io.BytesIO()
+        with wave.open(wav_buffer, 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(pcm_data)
+        return wav_buffer.getvalue()
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _silence_wav(seconds: float) -> bytes:
+        """WAV of zeroed samples, built once per duration (chapter pause, fallback)."""
+        return NeuralProcessor._pcm_to_wav(bytes(int(seconds * DEFAULT_SAMPLE_RATE) * 2))
+
+    @staticmethod
+    def _wav_header(data_size: int, sample_rate: int = DEFAULT_SAMPLE_RATE) -> bytes:
+        """44-byte header for 16-bit mono PCM of data_size bytes."""
+        return struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + data_size, b'WAVE',
+            b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+            b'data', data_size
+        )
+
     @staticmethod
     def _split_at_word_boundary(text: str) -> tuple:
         """Split text near the midpoint at a word boundary. Returns (part1, part2)."""
@@ -402,18 +467,7 @@ class NeuralProcessor:
         """Process a single text chunk to audio with Neural Engine."""
         if not chunk_text.strip():
             # Empty chunks are chapter break markers — insert chapter pause
-            silence_samples = int(self.pause_between_chapters * DEFAULT_SAMPLE_RATE)
-            silence_data = b'\\x00\\x00' * silence_samples
-
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, 'wb') as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(DEFAULT_SAMPLE_RATE)
-                wav_file.writeframes(silence_data)
-
-            wav_buffer.seek(0)
-            return wav_buffer.read()
+            return self._silence_wav(self.pause_between_chapters)
 
         try:
             # Clean the text to prevent TTS issues
@@ -426,12 +480,7 @@ class NeuralProcessor:
             clean_text = self.number_expander.expand_numbers(clean_text)
 
             # Replace problematic characters
-            clean_text = clean_text.replace('\\u00a0', ' ')  # Non-breaking space
-            clean_text = clean_text.replace('\\u2013', '-')  # En dash
-            clean_text = clean_text.replace('\\u2014', '-')  # Em dash
-            clean_text = clean_text.replace('\\u2019', "'")  # Right single quote
-            clean_text = clean_text.replace('\\u201c', '"')  # Left double quote
-            clean_text = clean_text.replace('\\u201d', '"')  # Right double quote
+            clean_text = clean_text.translate(PUNCTUATION_TABLE)
 
             # Character voice detection - detect speaker and use appropriate voice
             if self.character_mapper and self.dialogue_detector:
@@ -443,14 +492,7 @@ class NeuralProcessor:
                     return self._synthesize_with_character_voices(segments, tts_engine, voice_blend, speed)
 
             # Default: use provided voice blend (narrator voice)
-            if len(voice_blend) == 1:
-                # Single voice
-                voice_id, _ = list(voice_blend.items())[0]
-                voice_str = voice_id
-            else:
-                # Voice blending - create voice spec string
-                voice_parts = [f"{voice}:{int(weight*100)}" for voice, weight in voice_blend.items()]
-                voice_str = ",".join(voice_parts)
+            voice_str = self._voice_blend_to_str(voice_blend)
 
             # G2P phonemization (optional, improves pronunciation if misaki is installed)
             is_phonemes = False
@@ -467,6 +509,8 @@ class NeuralProcessor:
                                          default_voice_blend: Dict[str, float], speed: float) -> bytes:
         """Synthesize text segments with character-specific voices."""
         audio_parts = []
+        # Render the narrator voice spec once, not per segment
+        default_voice_str = self._voice_blend_to_str(default_voice_blend)
 
         for segment in segments:
             if not segment.text.strip():
@@ -480,10 +524,10 @@ class NeuralProcessor:
                     voice_str = char_voice.voice_id
                 else:
                     # Speaker detected but no mapping - use default voice
-                    voice_str = self._voice_blend_to_str(default_voice_blend)
+                    voice_str = default_voice_str
             else:
                 # Narration - use default narrator voice
-                voice_str = self._voice_blend_to_str(default_voice_blend)
+                voice_str = default_voice_str
 
             # Synthesize segment
             try:
@@ -491,25 +535,13 @@ class NeuralProcessor:
                 audio_parts.append(audio_data)
             except Exception as e:
                 # Fall back to default voice on error
-                voice_str = self._voice_blend_to_str(default_voice_blend)
-                audio_data = tts_engine.synthesize(segment.text.strip(), voice_str, speed)
+                audio_data = tts_engine.synthesize(segment.text.strip(), default_voice_str, speed)
                 audio_parts.append(audio_data)
 
         # Concatenate all audio parts
         if not audio_parts:
             # Return silence if nothing was synthesized
-            silence_samples = int(SILENCE_DURATION * DEFAULT_SAMPLE_RATE)
-            silence_data = b'\\x00\\x00' * silence_samples
-
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, 'wb') as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(DEFAULT_SAMPLE_RATE)
-                wav_file.writeframes(silence_data)
-
-            wav_buffer.seek(0)
-            return wav_buffer.read()
+            return self._silence_wav(SILENCE_DURATION)
 
         return self._concatenate_audio_segments(audio_parts)
 
@@ -521,13 +553,16 @@ class NeuralProcessor:
             return w.readframes(w.getnframes())
 
     def _voice_blend_to_str(self, voice_blend: Dict[str, float]) -> str:
-        """Convert voice blend dict to voice string."""
-        if len(voice_blend) == 1:
-            voice_id, _ = list(voice_blend.items())[0]
-            return voice_id
-        else:
-            voice_parts = [f"{voice}:{int(weight*100)}" for voice, weight in voice_blend.items()]
-            return ",".join(voice_parts)
+        """Convert voice blend dict to voice string (formatted once per blend)."""
+        return self._voice_spec(tuple(voice_blend.items()))
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _voice_spec(voice_items: tuple) -> str:
+        """Voice spec string for (voice, weight) pairs, e.g. "af_sarah:60,bm_fable:40"."""
+        if len(voice_items) == 1:
+            return voice_items[0][0]
+        return ",".join(f"{voice}:{int(weight*100)}" for voice, weight in voice_items)
 
     def _concatenate_audio_segments(self, audio_parts: List[bytes]) -> bytes:
         """Concatenate multiple WAV audio segments into one."""
@@ -558,25 +593,11 @@ class NeuralProcessor:
         if not all_audio_data:
             raise RuntimeError("Failed to concatenate audio segments")
 
-        # Create final WAV
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, 'wb') as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
-
-            for audio_data in all_audio_data:
-                wav_file.writeframes(audio_data)
-
-        wav_buffer.seek(0)
-        return wav_buffer.read()
+        # Create final WAV (one join, one header)
+        return self._pcm_to_wav(b''.join(all_audio_data), sample_rate)
     
-    def _convert_and_write_chunk(self, output_file, audio_data: bytes):
-        """Stream WAV chunk data to disk with crossfade to prevent clicks at boundaries."""
-        wav_buffer = io.BytesIO(audio_data)
-        with wave.open(wav_buffer, 'rb') as wav:
-            frames = wav.readframes(wav.getnframes())
-
+    def _write_chunk_frames(self, output_file, frames: bytes):
+        """Stream raw PCM frames to disk, crossfading with the previous chunk's tail."""
         fade_bytes = CROSSFADE_SAMPLES * 2  # 2 bytes per sample (16-bit)
 
         if self._prev_tail is not None and len(frames) >= fade_bytes:
@@ -614,11 +635,9 @@ class NeuralProcessor:
         print(f"🎵 Converting {file_size_mb:.0f}MB raw audio to MP3 (streaming via FFmpeg)", flush=True)
 
         try:
-            import subprocess
-            from ..utils.setup import get_ffmpeg_path
-            from ..config import ConfigManager
+            from ..config import get_config_manager
 
-            bitrate = ConfigManager().config.audio.bitrate
+            bitrate = get_config_manager().config.audio.bitrate
 
             # Feed raw PCM directly to FFmpeg - no need to reconstruct WAV in memory
             cmd = [
@@ -652,24 +671,28 @@ class NeuralProcessor:
     def _fallback_save_as_wav(self):
         """Save raw PCM temp file as proper WAV when MP3 conversion fails.
 
-        Streams in chunks to avoid loading entire file into memory.
+        Writes the header, then copies the PCM in-kernel with os.sendfile
+        (8MB userspace chunks where sendfile cannot target a file).
         """
         if not self.temp_wav_path or not self.temp_wav_path.exists():
             return
         wav_output = self.output_path.with_suffix('.wav')
         raw_size = self.temp_wav_path.stat().st_size
         try:
-            with wave.open(str(wav_output), 'wb') as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(DEFAULT_SAMPLE_RATE)
-                # Stream raw PCM data in 8MB chunks
-                with open(self.temp_wav_path, 'rb') as raw_f:
-                    while True:
-                        chunk = raw_f.read(8 * 1024 * 1024)
-                        if not chunk:
+            with open(self.temp_wav_path, 'rb') as raw_f, open(wav_output, 'wb') as wav_f:
+                wav_f.write(self._wav_header(raw_size))
+                wav_f.flush()
+                offset = 0
+                try:
+                    while offset < raw_size:
+                        sent = os.sendfile(wav_f.fileno(), raw_f.fileno(), offset, raw_size - offset)
+                        if sent == 0:
                             break
-                        wav_file.writeframes(chunk)
+                        offset += sent
+                except (AttributeError, OSError):
+                    # No os.sendfile (Windows) or no file-to-file sendfile (macOS)
+                    raw_f.seek(offset)
+                    shutil.copyfileobj(raw_f, wav_f, 8 * 1024 * 1024)
             self.temp_wav_path.unlink(missing_ok=True)
             # Update output_path so _move_to_finished finds the right file
             self.output_path = wav_output
@@ -678,8 +701,36 @@ class NeuralProcessor:
     
     def _get_settings_hash(self, config: Dict[str, Any]) -> str:
         """Generate hash of processing settings to detect changes."""
-        config_str = json.dumps(config, sort_keys=True)
-        return hashlib.md5(config_str.encode()).hexdigest()[:8]
+        config_str = json.dumps(config, sort_keys=True, separators=(',', ':'))
+        # Change-detection tag only: BLAKE2 is faster than MD5 and not blocked in FIPS mode
+        return hashlib.blake2b(config_str.encode(), digest_size=4).hexdigest()
+    
+    @staticmethod
+    def _get_file_stat(file_path: Path) -> tuple:
+        """Return (size, mtime_ns) of the source, or (0, 0) if it cannot be read."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return 0, 0
+        return stat.st_size, stat.st_mtime_ns
+    
+    @staticmethod
+    def _get_file_hash(file_path: Path) -> str:
+        """Fingerprint the source file to detect edits between runs.
+
+        Hashes the size plus fixed-size samples from the start, middle and end
+        instead of the whole file, so cost does not grow with the book.
+        """
+        try:
+            size = file_path.stat().st_size
+            hasher = hashlib.blake2b(size.to_bytes(8, 'little'), digest_size=8)
+            with open(file_path, 'rb') as f:
+                for offset in (0, size // 2, max(0, size - FINGERPRINT_SAMPLE_BYTES)):
+                    f.seek(offset)
+                    hasher.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+        except OSError:
+            return ''
+        return hasher.hexdigest()
     
     def _load_checkpoint(self, file_path: Path, total_chunks: int, settings_hash: str) -> tuple[int, int]:
         """Load checkpoint and verify integrity."""
@@ -706,6 +757,7 @@ class NeuralProcessor:
                     f.write(f"File match: {checkpoint.file_path == relative_path}\n")
                     f.write(f"Chunks match: {checkpoint.total_chunks == total_chunks}\n")
                     f.write(f"Settings match: {checkpoint.settings_hash == settings_hash}\n")
+                    f.write(f"Source stat match: {(checkpoint.file_size, checkpoint.file_mtime_ns) == self.file_stat}\n")
 
             # Verify checkpoint is for same file and settings
             if (checkpoint.file_path != relative_path or
@@ -715,6 +767,17 @@ class NeuralProcessor:
                 self._cleanup_checkpoint()
                 return 0, 0
 
+            # Same size and mtime as at save time: reuse the fingerprint unread
+            if checkpoint.file_hash and (checkpoint.file_size, checkpoint.file_mtime_ns) == self.file_stat:
+                self.file_hash = checkpoint.file_hash
+            else:
+                self.file_hash = self._get_file_hash(file_path)
+                # Source edited since the checkpoint (older checkpoints have no fingerprint)
+                if checkpoint.file_hash and checkpoint.file_hash != self.file_hash:
+                    print("🔄 Source file changed, starting fresh")
+                    self._cleanup_checkpoint()
+                    return 0, 0
+
             # For MP3: check temp WAV file, for WAV: check output file
             actual_file = self.temp_wav_path if self.is_mp3_output else self.output_path
 
@@ -753,30 +816,75 @@ class NeuralProcessor:
             total_chunks=total_chunks,
             output_size=output_size,
             settings_hash=settings_hash,
-            timestamp=time.time()
+            timestamp=time.time(),
+            file_hash=self.file_hash,
+            file_size=self.file_stat[0],
+            file_mtime_ns=self.file_stat[1]
         )
         
+        if self._checkpoint_queue is None:
+            self._write_checkpoint(checkpoint)
+            return
+        
+        # Only the newest checkpoint matters: replace a pending one instead of blocking
+        try:
+            self._checkpoint_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._checkpoint_queue.put(checkpoint)
+    
+    def _write_checkpoint(self, checkpoint: NeuralCheckpoint):
+        """Write a checkpoint to disk atomically (temp file, fsync, rename)."""
+        tmp_path = self.checkpoint_path.with_suffix('.checkpoint.tmp')
         try:
-            with open(self.checkpoint_path, 'w') as f:
+            with open(tmp_path, 'w') as f:
                 json.dump(asdict(checkpoint), f)
+                f.flush()
+                os.fsync(f.fileno())
+            # A crash mid-write leaves the previous checkpoint intact
+            os.replace(tmp_path, self.checkpoint_path)
             
             # Suppress checkpoint messages for screen-clearing displays to avoid visual clutter
             # (timeseries/rich displays clear screen and show their own progress)
         except Exception as e:
             print(f"⚠️ Failed to save checkpoint: {e}")
     
+    def _start_checkpoint_writer(self):
+        """Start the thread that writes checkpoints off the synthesis loop."""
+        self._checkpoint_queue = queue.Queue(maxsize=1)
+        self._checkpoint_thread = threading.Thread(
+            target=self._checkpoint_worker, name="checkpoint-writer", daemon=True
+        )
+        self._checkpoint_thread.start()
+    
+    def _stop_checkpoint_writer(self):
+        """Flush the pending checkpoint (if any) and stop the writer thread."""
+        if self._checkpoint_queue is None:
+            return
+        self._checkpoint_queue.put(None)
+        self._checkpoint_thread.join()
+        self._checkpoint_queue = None
+        self._checkpoint_thread = None
+    
+    def _checkpoint_worker(self):
+        """Write queued checkpoints until a None sentinel arrives."""
+        while True:
+            checkpoint = self._checkpoint_queue.get()
+            if checkpoint is None:
+                break
+            self._write_checkpoint(checkpoint)
+    
     def _cleanup_checkpoint(self):
         """Remove checkpoint and temp files."""
         if self.checkpoint_path.exists():
             self.checkpoint_path.unlink()
+        self.checkpoint_path.with_suffix('.checkpoint.tmp').unlink(missing_ok=True)
         # Clean up temp WAV if it still exists
         if self.temp_wav_path and self.temp_wav_path.exists():
             self.temp_wav_path.unlink()
 
     def _move_to_finished(self) -> Path:
         """Move completed file to final output directory."""
-        import shutil
-
         # Ensure output directory exists
         self.final_output_dir.mkdir(parents=True, exist_ok=True)
 
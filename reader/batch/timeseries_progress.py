@@ -15,6 +15,9 @@ except ImportError:
 class TimeseriesProgressDisplay(ProgressDisplay):
     """Timeseries visualization with ASCII charts showing processing speed over time."""
 
+    # Redraw at most once per interval (seconds); the final chunk always redraws
+    MIN_UPDATE_INTERVAL = 1.0
+
     def __init__(self, debug: bool = False):
         if not PLOTEXT_AVAILABLE:
             raise ImportError("Plotext is not available")
@@ -38,6 +41,8 @@ class TimeseriesProgressDisplay(ProgressDisplay):
     
     def update(self, current_chunk: int, total_chunks: int, elapsed_time: float, eta_seconds: float):
         current_time = time.time()
+        if current_time - self.last_update_time < self.MIN_UPDATE_INTERVAL and current_chunk != total_chunks:
+            return
         progress_pct = (current_chunk / total_chunks) * 100
 
         # Calculate instantaneous speed (chunks per minute)
@@ -53,8 +58,11 @@ class TimeseriesProgressDisplay(ProgressDisplay):
         self.speed_history.append(instant_speed)
         self.time_history.append(relative_time)
 
-        # Clear screen and draw updated chart
-        os.system('clear' if os.name == 'posix' else 'cls')
+        # Clear screen and draw updated chart (ANSI escape, no subprocess, on POSIX)
+        if os.name == 'posix':
+            print("\033[2J\033[H", end='')
+        else:
+            os.system('cls')
 
         # Print header
         elapsed_mins = int(elapsed_time // 60)
@@ -171,7 +171,9 @@ class ChapterManager:
         
         # Group sections into chapters (rough estimation)
         words_per_chapter = 2000  # Target words per chapter
-        current_chapter_text = ""
+        # Sections are buffered and joined once per chapter to avoid
+        # re-copying the growing chapter string on every append
+        current_sections: List[str] = []
         current_word_count = 0
         chapter_number = 1
         
@@ -184,30 +186,27 @@ class ChapterManager:
             
             # If adding this section would exceed target, finalize current chapter
             if current_word_count > 0 and current_word_count + section_words > words_per_chapter:
-                if current_chapter_text:
+                if current_sections:
                     chapter = ChapterInfo(
                         title=f"Chapter {chapter_number}",
-                        text_content=current_chapter_text.strip()
+                        text_content="\n\n".join(current_sections)
                     )
                     chapters.append(chapter)
                     chapter_number += 1
                 
                 # Start new chapter
-                current_chapter_text = section
+                current_sections = [section]
                 current_word_count = section_words
             else:
                 # Add to current chapter
-                if current_chapter_text:
-                    current_chapter_text += "\n\n" + section
-                else:
-                    current_chapter_text = section
+                current_sections.append(section)
                 current_word_count += section_words
         
         # Add the last chapter
-        if current_chapter_text:
+        if current_sections:
             chapter = ChapterInfo(
                 title=f"Chapter {chapter_number}",
-                text_content=current_chapter_text.strip()
+                text_content="\n\n".join(current_sections)
             )
             chapters.append(chapter)
         
@@ -313,9 +312,7 @@ class ChapterManager:
                 # If no bookmarks, fallback to text-based detection
                 if not chapters:
                     # Extract all text first
-                    full_text = ""
-                    for page in pdf_reader.pages:
-                        full_text += page.extract_text() + "\n"
+                    full_text = "".join(page.extract_text() + "\n" for page in pdf_reader.pages)
                     
                     chapters = self.extract_chapters_from_text(full_text, "pdf")
             
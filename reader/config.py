@@ -293,4 +293,23 @@ class ConfigManager:
             except:
                 pass
         
-        return {}
\ No newline at end of file
+        return {}
+
+# Shared user-level config for read-only lookups (fallback voice, bitrate)
+_user_config_manager = None
+
+
+def get_config_manager() -> ConfigManager:
+    """Get singleton ConfigManager loaded from the user config file.
+
+    Avoids re-reading and re-parsing config.yaml on every lookup. Callers
+    that need project config or CLI overrides should build their own
+    ConfigManager instead of mutating this shared one.
+
+    Returns:
+        Shared ConfigManager instance
+    """
+    global _user_config_manager
+    if _user_config_manager is None:
+        _user_config_manager = ConfigManager()
+    return _user_config_manager
@@ -116,6 +116,24 @@ class KokoroEngine(TTSEngine):
     # Compiled regex patterns for text chunking (performance optimization)
     SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
     PUNCTUATION_SPLIT_PATTERN = re.compile(r'([,;:—–\-])\s*')
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+
+    # Problematic unicode characters and their plain replacements
+    SANITIZE_TABLE = str.maketrans({
+        '\u2018': "'",  # Left single quote
+        '\u2019': "'",  # Right single quote
+        '\u201c': '"',  # Left double quote
+        '\u201d': '"',  # Right double quote
+        '\u2013': '-',  # En dash
+        '\u2014': '-',  # Em dash
+        '\u2026': '...',  # Ellipsis
+    })
+
+    # Language inferred from the first letter of voice IDs not listed in VOICES
+    VOICE_PREFIX_LANGS = {
+        'a': 'en-us', 'b': 'en-gb', 'e': 'es', 'f': 'fr',
+        'h': 'hi', 'i': 'it', 'j': 'ja', 'p': 'pt-br', 'z': 'zh',
+    }
     
     
     def _ensure_initialized(self) -> None:
@@ -406,36 +424,20 @@ class KokoroEngine(TTSEngine):
             return self.VOICES[voice_id]["lang"]
 
         # Infer from voice ID prefix
-        prefix_lang = {
-            'a': 'en-us', 'b': 'en-gb', 'e': 'es', 'f': 'fr',
-            'h': 'hi', 'i': 'it', 'j': 'ja', 'p': 'pt-br', 'z': 'zh',
-        }
         if voice_id and len(voice_id) >= 2:
-            return prefix_lang.get(voice_id[0], 'en-us')
+            return self.VOICE_PREFIX_LANGS.get(voice_id[0], 'en-us')
         return 'en-us'
 
     def _sanitize_text(self, text: str) -> str:
         """Sanitize text to avoid Kokoro synthesis errors."""
-        import re
-
         # Remove control characters except newlines and tabs
         text = ''.join(char for char in text if char.isprintable() or char in '\n\t ')
 
-        # Replace problematic unicode characters
-        replacements = {
-            '\u2018': "'",  # Left single quote
-            '\u2019': "'",  # Right single quote
-            '\u201c': '"',  # Left double quote
-            '\u201d': '"',  # Right double quote
-            '\u2013': '-',  # En dash
-            '\u2014': '-',  # Em dash
-            '\u2026': '...',  # Ellipsis
-        }
-        for old, new in replacements.items():
-            text = text.replace(old, new)
+        # Replace problematic unicode characters (one pass via lookup table)
+        text = text.translate(self.SANITIZE_TABLE)
 
         # Limit consecutive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = self.WHITESPACE_PATTERN.sub(' ', text)
 
         # Ensure text is not empty
         if not text.strip():
@@ -562,15 +564,25 @@ class KokoroEngine(TTSEngine):
         return self._samples_to_wav_bytes(merged_samples, sample_rate)
 
     def _synthesize_chunks_streaming(self, chunks: List[str], voice_blend: Dict[str, float], speed: float) -> bytes:
-        """Memory-efficient synthesis using temporary files for large texts."""
-        import tempfile
-        
-        temp_files = []
-        sample_rate = None
-        total_chunks = len(chunks)
-        
-        try:
-            # Process chunks and save to temporary files
+        """Memory-efficient synthesis for large texts.
+
+        Each chunk's PCM is appended to one temporary WAV as soon as it is
+        synthesized, so only the finished file is ever read back into memory.
+        """
+        import wave
+
+        with tempfile.TemporaryFile() as temp_file:
+            wav_file = None
+
+            def append(samples, sample_rate: int) -> None:
+                nonlocal wav_file
+                if wav_file is None:
+                    wav_file = wave.open(temp_file, 'wb')
+                    wav_file.setnchannels(1)  # Mono
+                    wav_file.setsampwidth(2)  # 16-bit
+                    wav_file.setframerate(sample_rate)
+                wav_file.writeframesraw(self._samples_to_pcm(samples))
+
             for i, chunk in enumerate(chunks):
                 if not chunk.strip():
                     continue
@@ -598,15 +610,7 @@ class KokoroEngine(TTSEngine):
                             lang=self._get_voice_lang(primary_voice)
                         )
 
-                    if sample_rate is None:
-                        sample_rate = chunk_sample_rate
-
-                    # Save to temporary file
-                    temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-                    wav_data = self._samples_to_wav_bytes(samples, chunk_sample_rate)
-                    temp_file.write(wav_data)
-                    temp_file.close()
-                    temp_files.append(temp_file.name)
+                    append(samples, chunk_sample_rate)
 
                 except Exception as e:
                     # Split the failing chunk and retry
@@ -619,67 +623,19 @@ class KokoroEngine(TTSEngine):
                             sanitized_sub = self._sanitize_text(sub.strip())
                             voice_id = list(voice_blend.keys())[0] if len(voice_blend) == 1 else max(voice_blend.items(), key=lambda x: x[1])[0]
                             samples, sr = self.kokoro.create(text=sanitized_sub, voice=voice_id, speed=speed, lang=self._get_voice_lang(voice_id))
-                            if sample_rate is None:
-                                sample_rate = sr
-                            temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-                            wav_data = self._samples_to_wav_bytes(samples, sr)
-                            temp_file.write(wav_data)
-                            temp_file.close()
-                            temp_files.append(temp_file.name)
+                            append(samples, sr)
                         except Exception as sub_e:
                             print(f"⚠️  Sub-chunk also failed, skipping: {sub[:60]}...")
                             continue
                     continue
-            
-            if not temp_files:
+
+            if wav_file is None:
                 raise RuntimeError("Failed to synthesize any chunks from the text")
-            
-            # Concatenate temporary files
-            print(f"Merging {len(temp_files)} audio segments...")
-            return self._concatenate_temp_files(temp_files, sample_rate)
-            
-        finally:
-            # Clean up temporary files
-            for temp_file in temp_files:
-                try:
-                    Path(temp_file).unlink(missing_ok=True)
-                except:
-                    pass
-    
-    def _concatenate_temp_files(self, temp_files: List[str], sample_rate: int) -> bytes:
-        """Concatenate temporary audio files into a single audio stream."""
-        import wave
-        import io
-        
-        # Read all WAV files and concatenate the audio data
-        all_audio_data = []
-        
-        for temp_file in temp_files:
-            try:
-                with wave.open(temp_file, 'rb') as wav_file:
-                    audio_data = wav_file.readframes(wav_file.getnframes())
-                    all_audio_data.append(audio_data)
-            except Exception as e:
-                print(f"Warning: Failed to read temp file {temp_file}: {e}")
-                continue
-        
-        if not all_audio_data:
-            raise RuntimeError("Failed to read any temporary audio files")
-        
-        # Create final WAV file in memory
-        wav_buffer = io.BytesIO()
-        
-        with wave.open(wav_buffer, 'wb') as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            
-            # Write all concatenated audio data
-            for audio_data in all_audio_data:
-                wav_file.writeframes(audio_data)
-        
-        wav_buffer.seek(0)
-        return wav_buffer.read()
+
+            # Closing patches the header sizes; the temp file itself stays open
+            wav_file.close()
+            temp_file.seek(0)
+            return temp_file.read()
     
     def _chunk_text_intelligently(self, text: str, max_length: int = 400) -> List[str]:
         """Chunk text at natural break points while guaranteeing no chunk exceeds max_length."""
@@ -746,10 +702,9 @@ class KokoroEngine(TTSEngine):
 
         return safe_chunks
 
-    def _samples_to_wav_bytes(self, samples, sample_rate: int) -> bytes:
-        """Convert audio samples to WAV bytes."""
-        import io
-        import wave
+    @staticmethod
+    def _samples_to_pcm(samples) -> bytes:
+        """Convert audio samples to raw 16-bit PCM bytes."""
         import numpy as np
         
         # Ensure samples are in the right format for WAV
@@ -759,6 +714,13 @@ class KokoroEngine(TTSEngine):
                 samples = np.clip(samples, -1.0, 1.0)
                 samples = (samples * 32767).astype(np.int16)
         
+        return samples.tobytes()
+    
+    def _samples_to_wav_bytes(self, samples, sample_rate: int) -> bytes:
+        """Convert audio samples to WAV bytes."""
+        import io
+        import wave
+        
         # Create WAV file in memory
         wav_buffer = io.BytesIO()
         
@@ -766,7 +728,7 @@ class KokoroEngine(TTSEngine):
             wav_file.setnchannels(1)  # Mono
             wav_file.setsampwidth(2)  # 16-bit
             wav_file.setframerate(sample_rate)
-            wav_file.writeframes(samples.tobytes())
+            wav_file.writeframes(self._samples_to_pcm(samples))
         
         wav_buffer.seek(0)
         return wav_buffer.read()
@@ -24,9 +24,7 @@ class PDFParser(TextParser):
         Line break cleanup happens in _clean_paragraph_breaks (strip writer)
         and _chunk_text_intelligently (synthesis).
         """
-        # Replace tabs with spaces
-        text = text.replace('\t', ' ')
-        # Collapse multiple spaces (but not newlines)
+        # Collapse runs of tabs/spaces (but not newlines) in one pass
         text = re.sub(r'[^\S\n]+', ' ', text)
         # Rejoin hyphenated line breaks (e.g. "exam-\nple" -> "example")
         text = re.sub(r'(\w)-\n(\w)', r'\1\2', text)
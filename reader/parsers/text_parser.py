@@ -35,9 +35,8 @@ class PlainTextParser(TextParser):
             if content is None:
                 raise ValueError("Could not decode file with any supported encoding")
 
-            # Normalize whitespace artifacts (tabs, non-breaking spaces)
-            content = content.replace('\t', ' ')
-            content = content.replace('\u00a0', ' ')
+            # Normalize whitespace artifacts in one pass: runs of tabs,
+            # non-breaking spaces and spaces (but not newlines) become one space
             content = re.sub(r'[^\S\n]+', ' ', content)
 
             # Extract basic metadata
@@ -1,19 +1,310 @@
 """FFmpeg-based audio processor for Phase 3 advanced audio features."""
 import subprocess
 import tempfile
+import wave
+import os
+import shutil
+import concurrent.futures
+import importlib.util
+import itertools
+import math
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import SimpleNamespace
+from typing import List, Dict, Any, Optional, Tuple
 import json
 
 from ..interfaces.audio_processor import AudioProcessor
 from ..utils.setup import get_ffmpeg_path
 
-try:
+
+@lru_cache(maxsize=None)
+def _audio_libs_available() -> bool:
+    """Check for mutagen without importing it."""
+    return importlib.util.find_spec('mutagen') is not None
+
+
+@lru_cache(maxsize=None)
+def _load_audio_libs() -> SimpleNamespace:
+    """Import mutagen on first use; only tagging needs it."""
     from mutagen.mp4 import MP4, MP4Cover
     from mutagen.id3 import ID3, TIT2, TPE1, TALB, TRCK, TPOS, CHAP, CTOC
-    AUDIO_LIBS_AVAILABLE = True
-except ImportError:
-    AUDIO_LIBS_AVAILABLE = False
+    return SimpleNamespace(
+        MP4=MP4, MP4Cover=MP4Cover, ID3=ID3, TIT2=TIT2, TPE1=TPE1,
+        TALB=TALB, TRCK=TRCK, TPOS=TPOS, CHAP=CHAP, CTOC=CTOC,
+    )
+
+
+def __getattr__(name):
+    """Resolve AUDIO_LIBS_AVAILABLE lazily (PEP 562)."""
+    if name == 'AUDIO_LIBS_AVAILABLE':
+        return _audio_libs_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _run_tool(cmd, **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run for FFmpeg/FFprobe; the one place tools are spawned."""
+    return subprocess.run(cmd, **kwargs)
+
+
+_pool_state = threading.local()
+
+
+def _mark_pool_worker() -> None:
+    """Initializer run once on each shared-pool thread."""
+    _pool_state.worker = True
+
+
+def _in_shared_pool() -> bool:
+    """True on a shared-pool thread, where waiting on the pool can deadlock."""
+    return getattr(_pool_state, 'worker', False)
+
+
+@lru_cache(maxsize=None)
+def _shared_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Process-wide pool for FFmpeg/ffprobe jobs (threads start on first submit)."""
+    return concurrent.futures.ThreadPoolExecutor(thread_name_prefix="ffmpeg",
+                                                 initializer=_mark_pool_worker)
+
+
+@lru_cache(maxsize=None)
+def _ffmpeg_available(ffmpeg_path: str) -> bool:
+    """Check once per process (and per binary) whether FFmpeg runs."""
+    try:
+        _run_tool([ffmpeg_path, '-version'], capture_output=True, check=True)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        print("Warning: FFmpeg not found. Some audio operations may not work.")
+        print("Install FFmpeg: https://ffmpeg.org/download.html")
+        return False
+
+
+# loudnorm pass-2 filter; measurements are appended when pass 1 succeeds
+LOUDNORM_FILTER = 'loudnorm=I={target_lufs}:TP=-2.0:LRA=7.0'
+LOUDNORM_MEASURED = (':measured_I={input_i}:measured_LRA={input_lra}'
+                     ':measured_TP={input_tp}:measured_thresh={input_thresh}'
+                     ':offset={target_offset}:linear=true')
+
+# Ranges loudnorm accepts for each pass-1 measurement in pass 2
+LOUDNORM_MEASURED_RANGES = {
+    'input_i': (-99.0, 0.0),
+    'input_lra': (0.0, 99.0),
+    'input_tp': (-99.0, 99.0),
+    'input_thresh': (-99.0, 0.0),
+    'target_offset': (-99.0, 99.0),
+}
+
+# normalize_audio argv after the ffmpeg binary; only pass 1 needs loudnorm's log output
+NORMALIZE_ARGV = (
+    '-nostdin', '-hide_banner', '-loglevel', 'error',
+    '-i', '{input}', '-af', '{filter}',
+    '-c:a', '{codec}', '-b:a', '128k',
+    '-y', '{output}',
+)
+
+# Linux ioctl that shares a file's extents with another (reflink copy)
+FICLONE = 0x40049409
+
+# Frames per read when copying PCM between WAV files
+WAV_COPY_FRAMES = 1 << 16
+
+# FFMETADATA1 requires these characters to be backslash-escaped in values
+FFMETADATA_ESCAPE = str.maketrans({char: '\\' + char for char in '=;#\\\n'})
+
+# AAC encoders in order of preference: AudioToolbox (macOS), Fraunhofer FDK, native
+AAC_ENCODER_PREFERENCE = ('aac_at', 'libfdk_aac', 'aac')
+
+
+@lru_cache(maxsize=None)
+def _aac_encoder(ffmpeg_path: str) -> str:
+    """Pick the fastest AAC encoder this FFmpeg build provides (probed once)."""
+    try:
+        result = _run_tool([ffmpeg_path, '-hide_banner', '-encoders'],
+                           capture_output=True, text=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return 'aac'
+    
+    # Encoder lines look like " A..... aac_at    AAC (AudioToolbox) ..."
+    available = {parts[1] for parts in map(str.split, result.stdout.splitlines()) if len(parts) > 1}
+    return next((name for name in AAC_ENCODER_PREFERENCE if name in available), 'aac')
+
+
+@lru_cache(maxsize=1024)
+def _probe_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Run ffprobe on a file and return its parsed JSON (format + streams).
+
+    mtime_ns and size are part of the cache key so a rewritten file is
+    probed again. Treat the returned dict as read-only.
+    """
+    cmd = [
+        'ffprobe', '-v', 'quiet', '-print_format', 'json',
+        '-show_format', '-show_streams', path
+    ]
+    result = _run_tool(cmd, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+@lru_cache(maxsize=4096)
+def _read_metadata(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Read title/artist/album tags with mutagen.
+
+    mtime_ns and size are part of the cache key so retagged files are read
+    again. Treat the returned dict as read-only.
+    """
+    metadata = {}
+    file_ext = Path(path).suffix.lower()
+    
+    try:
+        libs = _load_audio_libs()
+        if file_ext in ['.m4a', '.m4b']:
+            audiofile = libs.MP4(path)
+            metadata.update({
+                'title': audiofile.get('©nam', [''])[0],
+                'artist': audiofile.get('©ART', [''])[0],
+                'album': audiofile.get('©alb', [''])[0],
+                'genre': audiofile.get('©gen', [''])[0],
+            })
+        elif file_ext == '.mp3':
+            audiofile = libs.ID3(path)
+            metadata.update({
+                'title': str(audiofile.get('TIT2', '')),
+                'artist': str(audiofile.get('TPE1', '')),
+                'album': str(audiofile.get('TALB', '')),
+            })
+    except Exception:
+        pass  # Ignore metadata errors
+    
+    return metadata
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """Clone file extents (btrfs/XFS copy-on-write); False where unsupported."""
+    try:
+        import fcntl
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except (ImportError, OSError):
+        return False
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy a file via reflink or in-kernel sendfile, falling back to shutil.copy2."""
+    # Opening dst for writing would truncate src before the copy starts
+    if dst.exists() and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            if not _reflink(fsrc.fileno(), fdst.fileno()):
+                size = os.fstat(fsrc.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+    except (AttributeError, OSError):
+        # No os.sendfile (Windows) or no file-to-file sendfile (macOS)
+        shutil.copy2(src, dst)
+        return
+    shutil.copystat(src, dst)
+
+
+def _id3v2_tag_size(header: bytes) -> int:
+    """Return the length of a leading ID3v2 tag given a file's first 10 bytes."""
+    if len(header) < 10 or header[:3] != b'ID3':
+        return 0
+    
+    # Tag size is a 28-bit synchsafe integer (7 bits per byte)
+    size = 0
+    for byte in header[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    
+    # Header, tag body and the optional footer (flag bit 4)
+    return 10 + size + (10 if header[5] & 0x10 else 0)
+
+
+# MPEG audio Layer III bitrates (kbps) by bitrate index, and sample rates by
+# sample-rate index, for MPEG-1 and for MPEG-2/2.5
+MP3_BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _mp3_header_frame_length(frame: bytes) -> Optional[int]:
+    """
+    Inspect the first audio frame of an MP3.
+    
+    Returns 0 for a plain audio frame, the frame's length when it is a CBR
+    "Info" header frame (safe to drop), or None when the stream cannot be
+    joined byte for byte: no frame sync, or a VBR "Xing"/"VBRI" header whose
+    frame count and seek table would describe only this one file.
+    """
+    if len(frame) < 4 or frame[0] != 0xFF or frame[1] & 0xE0 != 0xE0:
+        return None
+    
+    version = (frame[1] >> 3) & 0x03  # 3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5
+    bitrate_index = frame[2] >> 4
+    rate_index = (frame[2] >> 2) & 0x03
+    if version == 1 or (frame[1] >> 1) & 0x03 != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None  # reserved version, not Layer III, free-format or bad rate
+    
+    mono = frame[3] >> 6 == 3
+    if version == 3:
+        side_info = 17 if mono else 32
+    else:
+        side_info = 9 if mono else 17
+    
+    if frame[36:40] == b'VBRI' or frame[4 + side_info:8 + side_info] == b'Xing':
+        return None
+    if frame[4 + side_info:8 + side_info] != b'Info':
+        return 0
+    
+    bitrate = MP3_BITRATES[1 if version == 3 else 2][bitrate_index] * 1000
+    sample_rate = MP3_SAMPLE_RATES[version][rate_index]
+    padding = (frame[2] >> 1) & 0x01
+    return (144 if version == 3 else 72) * bitrate // sample_rate + padding
+
+
+def _mp3_tail_tags_size(tail: bytes) -> int:
+    """Length of trailing ID3v1 and APEv2 tags given the last bytes of an MP3."""
+    size = 0
+    if len(tail) >= 128 and tail[-128:-125] == b'TAG':
+        size = 128
+    
+    # APEv2 footer sits right before any ID3v1 tag; its size field covers the
+    # items and footer, plus a 32-byte header when flag bit 31 is set
+    footer = tail[len(tail) - size - 32:len(tail) - size]
+    if len(footer) == 32 and footer[:8] == b'APETAGEX':
+        ape_size = int.from_bytes(footer[12:16], 'little')
+        flags = int.from_bytes(footer[20:24], 'little')
+        size += ape_size + (32 if flags & 0x80000000 else 0)
+    return size
+
+
+def _mp3_audio_span(path: Path) -> Optional[Tuple[int, int]]:
+    """
+    Byte range of an MP3's audio frames, without tags or a CBR Info frame.
+    
+    Returns None when the file cannot be safely joined byte for byte.
+    """
+    with open(path, 'rb') as f:
+        file_size = os.fstat(f.fileno()).st_size
+        start = _id3v2_tag_size(f.read(10))
+        f.seek(start)
+        # Largest Layer III frame is 1441 bytes (320 kbps at 32 kHz, padded)
+        header_frame = _mp3_header_frame_length(f.read(1441))
+        if header_frame is None:
+            return None
+        start += header_frame
+        
+        # 128 bytes of ID3v1 plus a generous APE footer window
+        f.seek(max(start, file_size - 160))
+        end = file_size - _mp3_tail_tags_size(f.read())
+    
+    return (start, end) if end > start else None
 
 
 class FFmpegAudioProcessor(AudioProcessor):
@@ -21,21 +312,38 @@ class FFmpegAudioProcessor(AudioProcessor):
     
     SUPPORTED_FORMATS = ['wav', 'mp3', 'm4a', 'm4b', 'aac', 'ogg', 'flac']
     
+    # Export parameters per target format (MP3 bitrate comes from config)
+    EXPORT_PARAMETERS = {
+        'mp3': {'parameters': ('-ac', '1')},  # Mono for audiobooks
+        'm4a': {'codec': 'aac', 'bitrate': '128k', 'parameters': ('-movflags', '+faststart')},
+        'm4b': {'codec': 'aac', 'bitrate': '128k', 'parameters': ('-movflags', '+faststart')},
+        'wav': {'parameters': ('-acodec', 'pcm_s16le')},
+        'ogg': {'codec': 'libvorbis', 'parameters': ('-q:a', '5')},
+        'flac': {'codec': 'flac', 'parameters': ('-compression_level', '5')},
+    }
+    
+    # Codecs that target containers can take as-is (remux without re-encoding)
+    REMUX_COMPATIBLE = {
+        'aac': {'m4a', 'm4b', 'aac'},
+        'mp3': {'mp3'},
+        'flac': {'flac'},
+        'vorbis': {'ogg'},
+        'pcm_s16le': {'wav'},
+    }
+    
     def __init__(self):
         """Initialize the FFmpeg audio processor."""
-        if not AUDIO_LIBS_AVAILABLE:
+        if not _audio_libs_available():
             raise ImportError("Audio libraries not available. Install with: poetry add mutagen")
         
         self._check_ffmpeg()
+        
+        # loudnorm pass-1 measurements keyed by (path, size, mtime_ns)
+        self._loudness_cache: Dict[tuple, Dict[str, str]] = {}
     
-    def _check_ffmpeg(self) -> None:
-        """Check if FFmpeg is available on the system."""
-        try:
-            subprocess.run([get_ffmpeg_path(), '-version'],
-                         capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("Warning: FFmpeg not found. Some audio operations may not work.")
-            print("Install FFmpeg: https://ffmpeg.org/download.html")
+    def _check_ffmpeg(self) -> bool:
+        """Check if FFmpeg is available on the system (cached per process)."""
+        return _ffmpeg_available(get_ffmpeg_path())
     
     def convert_format(
         self,
@@ -61,18 +369,18 @@ class FFmpegAudioProcessor(AudioProcessor):
             
             cmd = [get_ffmpeg_path(), '-i', str(input_path)]
             
-            # Add format-specific parameters
-            export_params = self._get_export_parameters(target_format)
-            if 'codec' in export_params:
-                cmd.extend(['-c:a', export_params['codec']])
-            if 'bitrate' in export_params:
-                cmd.extend(['-b:a', export_params['bitrate']])
-            if 'parameters' in export_params:
-                cmd.extend(export_params['parameters'])
+            if self._can_remux(input_path, target_format):
+                # Codec already fits the target container: copy the stream
+                cmd.extend(['-vn', '-c:a', 'copy'])
+                if target_format.lower() in ['m4a', 'm4b']:
+                    cmd.extend(['-movflags', '+faststart'])
+            else:
+                # Add format-specific parameters
+                cmd.extend(self._export_args(target_format))
             
             cmd.extend(['-y', str(output_path)])
             
-            subprocess.run(cmd, check=True, capture_output=True)
+            _run_tool(cmd, check=True, capture_output=True)
             
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to convert audio with FFmpeg: {e}")
@@ -81,39 +389,239 @@ class FFmpegAudioProcessor(AudioProcessor):
         except Exception as e:
             raise RuntimeError(f"Failed to convert audio: {e}")
     
+    def _can_remux(self, input_path: Path, target_format: str) -> bool:
+        """Check whether the input's audio codec can be copied into target_format."""
+        stream = self._probe_audio_stream(input_path)
+        if stream is None:
+            return False
+        
+        target_format = target_format.lower()
+        if target_format not in self.REMUX_COMPATIBLE.get(stream.get('codec_name'), ()):
+            return False
+        
+        # MP3 exports are mono; stereo input still needs an encode
+        if target_format == 'mp3' and stream.get('channels') != 1:
+            return False
+        
+        return True
+    
+    def convert_format_batch(
+        self,
+        jobs: List[Tuple[Path, Path, str]],
+        max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Convert several files concurrently.
+        
+        Each conversion runs in its own FFmpeg process, so a thread pool is
+        enough to keep every core busy.
+        
+        Args:
+            jobs: (input_path, output_path, target_format) tuples
+            max_workers: Maximum concurrent FFmpeg processes (default: CPU count)
+        """
+        self._run_batch(self.convert_format, jobs, max_workers)
+    
+    def normalize_audio_batch(
+        self,
+        jobs: List[Tuple[Path, Path]],
+        target_lufs: float = -23.0,
+        max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Normalize several files concurrently.
+        
+        Args:
+            jobs: (input_path, output_path) tuples
+            target_lufs: Target LUFS level (default: -23.0 for audiobooks)
+            max_workers: Maximum concurrent FFmpeg processes (default: CPU count)
+        """
+        self._run_batch(self.normalize_audio, [(*job, target_lufs) for job in jobs], max_workers)
+    
+    @staticmethod
+    def _run_batch(operation, jobs: List[Tuple], max_workers: Optional[int]) -> None:
+        """Run operation over job argument tuples, re-raising the first failure.
+        
+        Jobs share one long-lived pool; a semaphore caps how many of this
+        batch's jobs are in flight at once, and no new jobs start after one
+        has failed. Jobs already running are waited for before raising.
+        """
+        if not jobs:
+            return
+        
+        if _in_shared_pool():
+            # Nested batch inside a pool job: run inline instead of waiting
+            # on a pool whose threads may all be busy waiting too
+            for job in jobs:
+                operation(*job)
+            return
+        
+        executor = _shared_executor()
+        gate = threading.BoundedSemaphore(min(max_workers or os.cpu_count() or 1, len(jobs)))
+        failed = threading.Event()
+        
+        def finished(future):
+            # Flag the failure before freeing the permit the submit loop waits on
+            if not future.cancelled() and future.exception() is not None:
+                failed.set()
+            gate.release()
+        
+        futures = []
+        for job in jobs:
+            gate.acquire()
+            if failed.is_set():
+                gate.release()
+                break
+            try:
+                future = executor.submit(operation, *job)
+            except BaseException:
+                gate.release()
+                raise
+            future.add_done_callback(finished)
+            futures.append(future)
+        
+        # Let jobs already running finish before raising, so nothing is
+        # still writing output once the caller sees the failure
+        concurrent.futures.wait(futures)
+        for future in futures:
+            future.result()
+    
     def _get_export_parameters(self, format: str) -> Dict[str, Any]:
         """Get optimal export parameters for each format."""
         format = format.lower()
+        params = dict(self.EXPORT_PARAMETERS.get(format, {}))
+
+        if params.get('codec') == 'aac':
+            params['codec'] = _aac_encoder(get_ffmpeg_path())
 
         if format == 'mp3':
-            from ..config import ConfigManager
-            bitrate = ConfigManager().config.audio.bitrate
-            return {
-                'bitrate': bitrate,
-                'parameters': ['-ac', '1']  # Mono for audiobooks
-            }
-        elif format in ['m4a', 'm4b']:
-            return {
-                'codec': 'aac',
-                'bitrate': '128k',
-                'parameters': ['-movflags', '+faststart']
-            }
-        elif format == 'wav':
-            return {
-                'parameters': ['-acodec', 'pcm_s16le']
-            }
-        elif format == 'ogg':
-            return {
-                'codec': 'libvorbis',
-                'parameters': ['-q:a', '5']
-            }
-        elif format == 'flac':
-            return {
-                'codec': 'flac',
-                'parameters': ['-compression_level', '5']
-            }
-        else:
-            return {}
+            from ..config import get_config_manager
+            params['bitrate'] = get_config_manager().config.audio.bitrate
+
+        return params
+    
+    def _export_args(self, format: str) -> List[str]:
+        """FFmpeg encoder arguments for a target format."""
+        export_params = self._get_export_parameters(format)
+        args = []
+        if 'codec' in export_params:
+            args.extend(['-c:a', export_params['codec']])
+        if 'bitrate' in export_params:
+            args.extend(['-b:a', export_params['bitrate']])
+        if 'parameters' in export_params:
+            args.extend(export_params['parameters'])
+        return args
+    
+    def process_pipeline(
+        self,
+        input_path: Path,
+        output_path: Path,
+        target_format: Optional[str] = None,
+        *,
+        normalize: bool = True,
+        target_lufs: float = -23.0,
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+        album: Optional[str] = None,
+        chapters: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Convert, normalize and tag audio with a single FFmpeg encode.
+        
+        Equivalent to convert_format, normalize_audio and add_metadata run
+        in sequence, but the audio is decoded and encoded only once. Tags and
+        chapters are passed to FFmpeg as an FFMETADATA input.
+        
+        Args:
+            input_path: Input audio file
+            output_path: Output audio file
+            target_format: Target audio format (defaults to output suffix)
+            normalize: Apply two-pass loudnorm to target_lufs
+            target_lufs: Target LUFS level (default: -23.0 for audiobooks)
+            title: Title of the audiobook
+            author: Author name
+            album: Album/series name
+            chapters: List of chapter information (start_time/end_time in seconds)
+        """
+        target_format = (target_format or output_path.suffix[1:]).lower()
+        if target_format not in self.SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported format: {target_format}. "
+                           f"Supported: {self.SUPPORTED_FORMATS}")
+        
+        metadata_file = None
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            cmd = [get_ffmpeg_path(), '-i', str(input_path)]
+            
+            if title or author or album or chapters:
+                tags = {'genre': 'Audiobook'}
+                if title:
+                    tags['title'] = title
+                if author:
+                    tags['artist'] = author
+                    tags['album'] = album or f"{title} by {author}"
+                elif album:
+                    tags['album'] = album
+                if target_format in ['m4a', 'm4b']:
+                    tags['media_type'] = '2'  # stik atom: Audiobook
+                
+                duration = self._probe_duration(input_path) if chapters else 0.0
+                with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False,
+                                                 encoding='utf-8') as f:
+                    f.write(self._ffmetadata(tags, chapters or [], duration))
+                    metadata_file = f.name
+                cmd.extend(['-i', metadata_file, '-map', '0:a',
+                            '-map_metadata', '1', '-map_chapters', '1'])
+            
+            if not normalize and self._can_remux(input_path, target_format):
+                cmd.extend(['-vn', '-c:a', 'copy'])
+                # _export_args adds faststart on the encode path
+                if target_format in ['m4a', 'm4b']:
+                    cmd.extend(['-movflags', '+faststart'])
+            else:
+                if normalize:
+                    cmd.extend(['-af', self._loudnorm_filter(input_path, target_lufs)])
+                cmd.extend(self._export_args(target_format))
+            
+            cmd.extend(['-y', str(output_path)])
+            
+            _run_tool(cmd, check=True, capture_output=True)
+            
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to process audio with FFmpeg: {e}")
+        except FileNotFoundError:
+            raise RuntimeError("FFmpeg not found. Please install FFmpeg: https://ffmpeg.org/download.html")
+        finally:
+            if metadata_file:
+                Path(metadata_file).unlink(missing_ok=True)
+    
+    @staticmethod
+    def _ffmetadata(
+        tags: Dict[str, str],
+        chapters: List[Dict[str, Any]],
+        duration: float
+    ) -> str:
+        """Render tags and chapters in FFmpeg's FFMETADATA1 format."""
+        lines = [';FFMETADATA1']
+        lines.extend(f"{key}={value.translate(FFMETADATA_ESCAPE)}" for key, value in tags.items())
+        
+        starts = [chapter.get('start_time', 0) for chapter in chapters]
+        for i, chapter in enumerate(chapters):
+            # Without an explicit end a chapter runs until the next one starts
+            end_time = chapter.get('end_time')
+            if end_time is None:
+                end_time = starts[i + 1] if i + 1 < len(chapters) else max(duration, starts[i])
+            title = chapter.get('title') or f'Chapter {i + 1}'
+            lines.extend([
+                '[CHAPTER]',
+                'TIMEBASE=1/1000',
+                f'START={int(starts[i] * 1000)}',
+                f'END={int(end_time * 1000)}',
+                f"title={title.translate(FFMETADATA_ESCAPE)}",
+            ])
+        
+        return '\n'.join(lines) + '\n'
     
     def add_metadata(
         self,
@@ -152,7 +660,7 @@ class FFmpegAudioProcessor(AudioProcessor):
     ) -> None:
         """Add metadata to M4A/M4B file."""
         try:
-            audiofile = MP4(str(audio_path))
+            audiofile = _load_audio_libs().MP4(str(audio_path))
             
             # Basic metadata
             audiofile['©nam'] = title  # Title
@@ -183,13 +691,14 @@ class FFmpegAudioProcessor(AudioProcessor):
     ) -> None:
         """Add metadata to MP3 file."""
         try:
-            audiofile = ID3(str(audio_path))
+            libs = _load_audio_libs()
+            audiofile = libs.ID3(str(audio_path))
             
             # Basic metadata
-            audiofile['TIT2'] = TIT2(encoding=3, text=title)  # Title
+            audiofile['TIT2'] = libs.TIT2(encoding=3, text=title)  # Title
             if author:
-                audiofile['TPE1'] = TPE1(encoding=3, text=author)  # Artist
-                audiofile['TALB'] = TALB(encoding=3, text=album or f"{title} by {author}")  # Album
+                audiofile['TPE1'] = libs.TPE1(encoding=3, text=author)  # Artist
+                audiofile['TALB'] = libs.TALB(encoding=3, text=album or f"{title} by {author}")  # Album
             
             # Add chapters if provided (ID3v2.3 CHAP frames)
             if chapters:
@@ -227,36 +736,38 @@ class FFmpegAudioProcessor(AudioProcessor):
     def _add_mp3_chapters(self, audiofile, chapters: List[Dict[str, Any]]) -> None:
         """Add chapter markers to MP3 file using ID3v2.3 CHAP frames."""
         try:
-            # Create table of contents
-            toc_children = []
+            libs = _load_audio_libs()
+            
+            # Precompute ids and millisecond offsets in one pass each
+            chapter_ids = [f"chp{i}" for i in range(len(chapters))]
+            starts_ms = [int(chapter.get('start_time', 0) * 1000) for chapter in chapters]
             
             for i, chapter in enumerate(chapters):
-                chapter_id = f"chp{i}"
-                start_ms = int(chapter.get('start_time', 0) * 1000)
-                end_ms = int(chapter.get('end_time', start_ms + 60000))  # Default 1 min if no end
-                title = chapter.get('title', f'Chapter {i + 1}')
+                start_ms = starts_ms[i]
+                end_time = chapter.get('end_time')
+                # end_time is in seconds like start_time; default 1 min if no end
+                end_ms = int(end_time * 1000) if end_time is not None else start_ms + 60000
+                title = chapter.get('title') or f'Chapter {i + 1}'
                 
                 # Add CHAP frame
-                audiofile.add(CHAP(
+                audiofile.add(libs.CHAP(
                     encoding=3,
-                    element_id=chapter_id,
+                    element_id=chapter_ids[i],
                     start_time=start_ms,
                     end_time=end_ms,
                     start_offset=0xFFFFFFFF,
                     end_offset=0xFFFFFFFF,
-                    sub_frames=[TIT2(encoding=3, text=title)]
+                    sub_frames=[libs.TIT2(encoding=3, text=title)]
                 ))
-                
-                toc_children.append(chapter_id)
             
             # Add table of contents
-            if toc_children:
-                audiofile.add(CTOC(
+            if chapter_ids:
+                audiofile.add(libs.CTOC(
                     encoding=3,
                     element_id="toc",
                     flags=0x03,  # Top-level and ordered
-                    child_element_ids=toc_children,
-                    sub_frames=[TIT2(encoding=3, text="Table of Contents")]
+                    child_element_ids=chapter_ids,
+                    sub_frames=[libs.TIT2(encoding=3, text="Table of Contents")]
                 ))
                 
         except Exception as e:
@@ -283,34 +794,49 @@ class FFmpegAudioProcessor(AudioProcessor):
             # Create output directory
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Create temporary file list for FFmpeg concat
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-                for input_file in input_files:
-                    f.write(f"file '{input_file.absolute()}'\n")
-                list_file = f.name
+            format = output_path.suffix[1:].lower()
+            can_copy = self._can_stream_copy(input_files, format)
+            spans = None
+            if can_copy and format == 'mp3' and self._same_bit_rate(input_files):
+                spans = [_mp3_audio_span(input_file) for input_file in input_files]
             
-            try:
-                # Use FFmpeg concat demuxer for merging
-                format = output_path.suffix[1:].lower()
-                export_params = self._get_export_parameters(format)
-                
-                cmd = [get_ffmpeg_path(), '-f', 'concat', '-safe', '0', '-i', list_file]
+            if spans and all(spans):
+                # CBR MP3 frames are self-contained, so matching streams can be
+                # joined byte for byte without starting FFmpeg at all
+                self._concat_mp3_files(input_files, spans, output_path)
+            else:
+                # VBR or mixed-bitrate MP3 and other containers go through FFmpeg
+                # Create temporary file list for FFmpeg concat
+                with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+                    for input_file in input_files:
+                        # Concat list syntax: a quote inside a quoted path is written '\''
+                        escaped = str(input_file.absolute()).replace("'", "'\\''")
+                        f.write(f"file '{escaped}'\n")
+                    list_file = f.name
                 
-                # Add format-specific parameters
-                if 'codec' in export_params:
-                    cmd.extend(['-c:a', export_params['codec']])
-                if 'bitrate' in export_params:
-                    cmd.extend(['-b:a', export_params['bitrate']])
-                if 'parameters' in export_params:
-                    cmd.extend(export_params['parameters'])
-                
-                cmd.extend(['-y', str(output_path)])
-                
-                subprocess.run(cmd, check=True, capture_output=True)
-                
-            finally:
-                # Clean up temporary file
-                Path(list_file).unlink(missing_ok=True)
+                try:
+                    # Use FFmpeg concat demuxer for merging
+                    cmd = [get_ffmpeg_path(), '-f', 'concat', '-safe', '0', '-i', list_file]
+                    
+                    if can_copy:
+                        # Homogeneous inputs: copy packets without decoding/re-encoding
+                        cmd.extend(['-c', 'copy'])
+                        if format in ['m4a', 'm4b']:
+                            cmd.extend(['-movflags', '+faststart'])
+                    else:
+                        # Add format-specific parameters
+                        cmd.extend(self._export_args(format))
+                    
+                    cmd.extend(['-y', str(output_path)])
+                    
+                    _run_tool(cmd, check=True, capture_output=True)
+                    
+                finally:
+                    # Clean up temporary file
+                    Path(list_file).unlink(missing_ok=True)
+            
+            if chapters:
+                self._write_chapters(output_path, self._offset_chapters(input_files, chapters))
             
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to merge audio files with FFmpeg: {e}")
@@ -319,6 +845,132 @@ class FFmpegAudioProcessor(AudioProcessor):
         except Exception as e:
             raise RuntimeError(f"Failed to merge audio files: {e}")
     
+    def _offset_chapters(
+        self,
+        input_files: List[Path],
+        chapters: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Shift chapters given per input file (``file_index``) onto the merged timeline."""
+        if not any('file_index' in chapter for chapter in chapters):
+            return list(chapters)
+        
+        # ffprobe is I/O bound, so probe every input concurrently (inline when
+        # already running on the shared pool, to avoid waiting on ourselves)
+        if _in_shared_pool():
+            durations = [self._probe_duration(input_file) for input_file in input_files]
+        else:
+            durations = list(_shared_executor().map(self._probe_duration, input_files))
+        offsets = [0.0, *itertools.accumulate(durations)]
+        
+        merged = []
+        for chapter in chapters:
+            offset = offsets[chapter['file_index']] if 'file_index' in chapter else 0.0
+            shifted = dict(chapter, start_time=chapter.get('start_time', 0) + offset)
+            if chapter.get('end_time') is not None:
+                shifted['end_time'] = chapter['end_time'] + offset
+            merged.append(shifted)
+        
+        # Without an explicit end a chapter runs until the next one starts
+        for i, chapter in enumerate(merged):
+            if chapter.get('end_time') is None:
+                next_start = merged[i + 1]['start_time'] if i + 1 < len(merged) else offsets[-1]
+                chapter['end_time'] = max(next_start, chapter['start_time'])
+        return merged
+    
+    @staticmethod
+    def _probe_duration(audio_path: Path) -> float:
+        """Duration of an audio file in seconds (0.0 if ffprobe reports none)."""
+        probe_data = FFmpegAudioProcessor._probe(audio_path)
+        return float(probe_data.get('format', {}).get('duration', 0))
+    
+    def _write_chapters(self, audio_path: Path, chapters: List[Dict[str, Any]]) -> None:
+        """Write chapter markers to a merged MP3/M4B file."""
+        libs = _load_audio_libs()
+        file_ext = audio_path.suffix.lower()
+        
+        if file_ext == '.mp3':
+            try:
+                audiofile = libs.ID3(str(audio_path))
+            except Exception:
+                audiofile = libs.ID3()  # Byte-concatenated output has no tag yet
+            self._add_mp3_chapters(audiofile, chapters)
+            audiofile.save(str(audio_path))
+        elif file_ext == '.m4b':
+            audiofile = libs.MP4(str(audio_path))
+            self._add_m4b_chapters(audiofile, chapters)
+            audiofile.save()
+    
+    @staticmethod
+    def _concat_mp3_files(
+        input_files: List[Path],
+        spans: List[Tuple[int, int]],
+        output_path: Path
+    ) -> None:
+        """Join CBR MP3 files by copying only each file's audio-frame byte span."""
+        with open(output_path, 'wb') as dst:
+            for input_file, (start, end) in zip(input_files, spans):
+                with open(input_file, 'rb') as src:
+                    src.seek(start)
+                    remaining = end - start
+                    while remaining > 0:
+                        block = src.read(min(remaining, 1 << 20))
+                        if not block:
+                            break
+                        dst.write(block)
+                        remaining -= len(block)
+    
+    def _can_stream_copy(self, input_files: List[Path], format: str) -> bool:
+        """Check whether inputs can be concatenated without re-encoding.
+
+        Requires every input to already be in the target format with the
+        same codec, sample rate and channel layout.
+        """
+        if any(input_file.suffix[1:].lower() != format for input_file in input_files):
+            return False
+        
+        signatures = set()
+        for input_file in input_files:
+            stream = self._probe_audio_stream(input_file)
+            if stream is None:
+                return False
+            signatures.add((
+                stream.get('codec_name'), stream.get('sample_rate'), stream.get('channels'),
+            ))
+            if len(signatures) > 1:
+                return False
+        
+        return True
+    
+    def _same_bit_rate(self, input_files: List[Path]) -> bool:
+        """Check that every input reports one bitrate (required to join MP3 bytes).
+
+        The concat demuxer copies streams of differing bitrate fine, so this
+        only gates the byte-level join, not stream copying in general.
+        """
+        bit_rates = set()
+        for input_file in input_files:
+            stream = self._probe_audio_stream(input_file)
+            bit_rates.add(stream.get('bit_rate') if stream else None)
+        return len(bit_rates) == 1 and None not in bit_rates
+    
+    @staticmethod
+    def _probe(audio_path: Path) -> Dict[str, Any]:
+        """Cached ffprobe format + streams for a file; shared by every caller."""
+        stat = audio_path.stat()
+        return _probe_file(str(audio_path), stat.st_mtime_ns, stat.st_size)
+    
+    def _probe_audio_stream(self, audio_path: Path) -> Optional[Dict[str, Any]]:
+        """Return the first audio stream reported by ffprobe, or None."""
+        try:
+            streams = self._probe(audio_path).get('streams', [])
+        except (subprocess.CalledProcessError, OSError, json.JSONDecodeError):
+            return None
+        
+        for stream in streams:
+            if stream.get('codec_type') == 'audio':
+                return stream
+        return None
+    
     def get_audio_info(self, audio_path: Path) -> Dict[str, Any]:
         """
         Get information about an audio file.
@@ -330,22 +982,11 @@ class FFmpegAudioProcessor(AudioProcessor):
             Dictionary with audio metadata and properties
         """
         try:
-            # Use FFprobe to get audio info
-            cmd = [
-                'ffprobe', '-v', 'quiet', '-print_format', 'json',
-                '-show_format', '-show_streams', str(audio_path)
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            probe_data = json.loads(result.stdout)
+            # Use FFprobe to get audio info (container headers only, no decode)
+            probe_data = self._probe(audio_path)
             
             # Extract audio stream info
-            audio_stream = None
-            for stream in probe_data.get('streams', []):
-                if stream.get('codec_type') == 'audio':
-                    audio_stream = stream
-                    break
-            
+            audio_stream = self._probe_audio_stream(audio_path)
             if not audio_stream:
                 raise RuntimeError("No audio stream found")
             
@@ -374,30 +1015,13 @@ class FFmpegAudioProcessor(AudioProcessor):
             }
     
     def _get_file_metadata(self, audio_path: Path) -> Dict[str, Any]:
-        """Extract metadata from audio file."""
-        metadata = {}
-        file_ext = audio_path.suffix.lower()
-        
+        """Extract metadata from audio file (cached until the file changes)."""
         try:
-            if file_ext in ['.m4a', '.m4b']:
-                audiofile = MP4(str(audio_path))
-                metadata.update({
-                    'title': audiofile.get('©nam', [''])[0],
-                    'artist': audiofile.get('©ART', [''])[0],
-                    'album': audiofile.get('©alb', [''])[0],
-                    'genre': audiofile.get('©gen', [''])[0],
-                })
-            elif file_ext == '.mp3':
-                audiofile = ID3(str(audio_path))
-                metadata.update({
-                    'title': str(audiofile.get('TIT2', '')),
-                    'artist': str(audiofile.get('TPE1', '')),
-                    'album': str(audiofile.get('TALB', '')),
-                })
-        except Exception:
-            pass  # Ignore metadata errors
+            stat = audio_path.stat()
+        except OSError:
+            return {}
         
-        return metadata
+        return dict(_read_metadata(str(audio_path), stat.st_mtime_ns, stat.st_size))
     
     def _format_duration(self, seconds: float) -> str:
         """Format duration in seconds to HH:MM:SS."""
@@ -414,6 +1038,10 @@ class FFmpegAudioProcessor(AudioProcessor):
         """
         Normalize audio to target LUFS level.
         
+        Uses the two-pass loudnorm workflow: pass 1 measures the input and
+        pass 2 applies a linear gain from those measurements. Falls back to
+        single-pass dynamic normalization if measuring fails.
+        
         Args:
             input_path: Input audio file
             output_path: Output normalized file
@@ -421,20 +1049,90 @@ class FFmpegAudioProcessor(AudioProcessor):
         """
         try:
             # Use FFmpeg for audio normalization
-            cmd = [
-                get_ffmpeg_path(), '-i', str(input_path),
-                '-af', f'loudnorm=I={target_lufs}:TP=-2.0:LRA=7.0',
-                '-c:a', 'aac', '-b:a', '128k',
-                '-y', str(output_path)
-            ]
+            values = {
+                'input': input_path,
+                'filter': self._loudnorm_filter(input_path, target_lufs),
+                'codec': _aac_encoder(get_ffmpeg_path()),
+                'output': output_path,
+            }
+            cmd = [get_ffmpeg_path(), *(arg.format_map(values) for arg in NORMALIZE_ARGV)]
             
-            subprocess.run(cmd, check=True, capture_output=True)
+            _run_tool(cmd, check=True, capture_output=True)
             
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to normalize audio: {e}")
         except FileNotFoundError:
             raise RuntimeError("FFmpeg not found. Please install FFmpeg: https://ffmpeg.org/download.html")
     
+    def _loudnorm_filter(self, input_path: Path, target_lufs: float) -> str:
+        """Build the pass-2 loudnorm filter, falling back to single-pass if measuring fails."""
+        loudnorm = LOUDNORM_FILTER.format(target_lufs=target_lufs)
+        
+        measured = self._measure_loudness(input_path, loudnorm)
+        if measured:
+            loudnorm += LOUDNORM_MEASURED.format_map(measured)
+        return loudnorm
+    
+    def _measure_loudness(self, input_path: Path, loudnorm: str) -> Optional[Dict[str, str]]:
+        """
+        Run loudnorm pass 1 and return its measurements.
+        
+        Measurements describe the input only, so they are cached per file
+        (path, size, mtime) and reused when normalizing to another target.
+        """
+        try:
+            stat = input_path.stat()
+        except OSError:
+            return None
+        cache_key = (str(input_path.resolve()), stat.st_size, stat.st_mtime_ns)
+        if cache_key in self._loudness_cache:
+            return self._loudness_cache[cache_key]
+        
+        cmd = [
+            get_ffmpeg_path(), '-hide_banner', '-i', str(input_path),
+            '-af', f'{loudnorm}:print_format=json',
+            '-f', 'null', '-'
+        ]
+        try:
+            result = _run_tool(cmd, check=True, capture_output=True, text=True)
+            # loudnorm prints its JSON block last on stderr
+            stderr = result.stderr
+            measured = json.loads(stderr[stderr.rindex('{'):stderr.rindex('}') + 1])
+            measured = {key: measured[key] for key in LOUDNORM_MEASURED_RANGES}
+            values = {key: float(value) for key, value in measured.items()}
+        except (subprocess.CalledProcessError, ValueError, KeyError, TypeError):
+            return None
+        
+        # Silent input measures as "-inf", which pass 2 rejects; fall back
+        # to the single-pass filter instead
+        for key, (low, high) in LOUDNORM_MEASURED_RANGES.items():
+            if not (math.isfinite(values[key]) and low <= values[key] <= high):
+                return None
+        
+        self._loudness_cache[cache_key] = measured
+        return measured
+    
+    @staticmethod
+    def _pad_wav(input_path: Path, output_path: Path,
+                 start_silence: float, end_silence: float) -> None:
+        """Splice silent PCM around a WAV file's frames without decoding or FFmpeg."""
+        with wave.open(str(input_path), 'rb') as src:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with wave.open(str(output_path), 'wb') as dst:
+                dst.setparams(src.getparams())
+                frame_size = src.getsampwidth() * src.getnchannels()
+                rate = src.getframerate()
+                # 8-bit WAV is unsigned, so its silence is 0x80 rather than zero
+                silence = b'\x80' if src.getsampwidth() == 1 else b'\x00'
+                
+                dst.writeframes(silence * (int(start_silence * rate) * frame_size))
+                # Copy in blocks so memory stays bounded for long recordings
+                frames = src.readframes(WAV_COPY_FRAMES)
+                while frames:
+                    dst.writeframes(frames)
+                    frames = src.readframes(WAV_COPY_FRAMES)
+                dst.writeframes(silence * (int(end_silence * rate) * frame_size))
+    
     def add_silence(self, input_path: Path, output_path: Path, 
                    start_silence: float = 0.0, end_silence: float = 0.0) -> None:
         """
@@ -447,31 +1145,39 @@ class FFmpegAudioProcessor(AudioProcessor):
             end_silence: Seconds of silence to add at end
         """
         try:
-            # Use FFmpeg to add silence with adelay and apad filters
+            format = output_path.suffix[1:].lower()
+            
+            # Nothing to splice: plain conversion (stream copy when possible)
+            if start_silence <= 0 and end_silence <= 0:
+                self.convert_format(input_path, output_path, format)
+                return
+            
+            if format == 'wav' and input_path.suffix.lower() == '.wav':
+                try:
+                    self._pad_wav(input_path, output_path, start_silence, end_silence)
+                    return
+                except (wave.Error, EOFError):
+                    pass  # Not plain PCM; let FFmpeg handle it
+            
+            # Use FFmpeg to add silence with adelay and apad filters (streaming,
+            # bounded memory regardless of file length)
             cmd = [get_ffmpeg_path(), '-i', str(input_path)]
             
             filters = []
             if start_silence > 0:
-                filters.append(f'adelay={int(start_silence * 1000)}|{int(start_silence * 1000)}')
+                # all=1 delays every channel, whatever the layout
+                filters.append(f'adelay={int(start_silence * 1000)}:all=1')
             if end_silence > 0:
                 filters.append(f'apad=pad_dur={end_silence}')
             
-            if filters:
-                cmd.extend(['-af', ','.join(filters)])
+            cmd.extend(['-af', ','.join(filters)])
             
             # Add format-specific parameters
-            format = output_path.suffix[1:].lower()
-            export_params = self._get_export_parameters(format)
-            if 'codec' in export_params:
-                cmd.extend(['-c:a', export_params['codec']])
-            if 'bitrate' in export_params:
-                cmd.extend(['-b:a', export_params['bitrate']])
-            if 'parameters' in export_params:
-                cmd.extend(export_params['parameters'])
+            cmd.extend(self._export_args(format))
             
             cmd.extend(['-y', str(output_path)])
             
-            subprocess.run(cmd, check=True, capture_output=True)
+            _run_tool(cmd, check=True, capture_output=True)
             
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to add silence with FFmpeg: {e}")
@@ -488,9 +1194,8 @@ class BasicAudioProcessor(AudioProcessor):
         """Basic format conversion (copy only for same format)."""
         if input_path.suffix.lower() == f".{target_format.lower()}":
             # Same format, just copy
-            import shutil
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(input_path, output_path)
+            _copy_file(input_path, output_path)
         else:
             raise NotImplementedError("Format conversion requires FFmpeg")
     
@@ -515,7 +1220,7 @@ class BasicAudioProcessor(AudioProcessor):
 
 def get_audio_processor() -> AudioProcessor:
     """Get the best available audio processor."""
-    if AUDIO_LIBS_AVAILABLE:
+    if _audio_libs_available():
         return FFmpegAudioProcessor()
     else:
         return BasicAudioProcessor()
\ No newline at end of file
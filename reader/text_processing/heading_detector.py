@@ -129,7 +129,11 @@ class HeadingDetector:
             if self._is_noise(stripped):
                 continue
 
-            # ALL CAPS lines with blank-line context
+            # ALL CAPS lines with blank-line context. str.isupper() is a C-level
+            # scan that exits on the first lowercase letter and rejects most
+            # prose lines; only candidates pay for the per-character check
+            if not stripped.isupper():
+                continue
             alpha_chars = [c for c in stripped if c.isalpha()]
             if len(alpha_chars) >= 3 and all(c.isupper() for c in alpha_chars):
                 if self._RE_PAGE_HEADER.match(stripped):
@@ -39,6 +39,7 @@ class NumberExpander:
     RANGE_PATTERN = re.compile(r'\b(\d+)[-–—](\d+)\b')  # Includes en/em dashes
     YEAR_PATTERN = re.compile(r'\b(1[0-9]{3}|20[0-9]{2})\b')  # 1000-2099
     CARDINAL_PATTERN = re.compile(r'\b(\d{1,3}(?:,\d{3})*|\d+)\b')
+    DIGIT_PATTERN = re.compile(r'\d')  # Every pattern above needs a digit
 
     def __init__(self):
         """Initialize number expander with lookup tables."""
@@ -97,6 +98,10 @@ class NumberExpander:
         Returns:
             Text with numbers expanded to words
         """
+        # Most prose chunks have no digits at all: one scan instead of nine passes
+        if not self.DIGIT_PATTERN.search(text):
+            return text
+
         text = self._expand_currency(text)
         text = self._expand_time(text)
         text = self._expand_fractions(text)
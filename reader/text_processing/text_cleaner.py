@@ -59,14 +59,17 @@ class TextCleaner:
 
         # Remove book catalog sections (e.g., "LE GUIN NOVELS Always Coming Home The Beginning Place...")
         # Only remove if it's a large block of capitalized titles
-        for match in self.catalog_pattern.finditer(text):
-            catalog_text = match.group(0)
-            # Only remove if it's long enough to be a real catalog (> 200 chars)
-            if len(catalog_text) > 200:
-                text = text.replace(catalog_text, '')
+        # Single pass: drop matches long enough to be a real catalog (> 200 chars)
+        text = self.catalog_pattern.sub(self._drop_catalog, text)
 
         return text
 
+    @staticmethod
+    def _drop_catalog(match: re.Match) -> str:
+        """Substitution callback removing catalog-sized matches only."""
+        catalog_text = match.group(0)
+        return '' if len(catalog_text) > 200 else catalog_text
+
     def should_skip_chapter(self, title: str, content: str = "",
                             epub_type: str = "", guide_type: str = "") -> bool:
         """Determine if chapter should be skipped.
@@ -27,6 +27,27 @@ class VoiceBlend:
 
 class CharacterVoiceMapper:
     """Manages character-to-voice mappings and voice blending."""
+
+    # Common words that aren't names (built once, not per candidate)
+    COMMON_WORDS = frozenset({
+        'he', 'she', 'they', 'it', 'i', 'you', 'we', 'us', 'them',
+        'said', 'asked', 'replied', 'told', 'spoke', 'answered',
+        'the', 'and', 'but', 'or', 'so', 'for', 'nor', 'yet',
+        'a', 'an', 'this', 'that', 'these', 'those'
+    })
+
+    # Dialogue attribution patterns; the speaker is always the "name" group
+    ATTRIBUTION_PATTERNS = [
+        re.compile(pattern, re.IGNORECASE) for pattern in (
+            r'"[^"]+"\s*,?\s*(?P<name>\w+)\s+said',
+            r'(?P<name>\w+)\s+said\s*,?\s*"[^"]+"',
+            r'"[^"]+"\s*,?\s*asked\s+(?P<name>\w+)',
+            r'(?P<name>\w+)\s+asked\s*,?\s*"[^"]+"',
+            r'(?P<name>\w+)\s+replied',
+            r'(?P<name>\w+)\s+whispered',
+            r'(?P<name>\w+)\s+shouted',
+        )
+    ]
     
     def __init__(self, config_dir: Path):
         """Initialize character voice mapper."""
@@ -39,6 +60,8 @@ class CharacterVoiceMapper:
         self.characters: Dict[str, CharacterVoice] = {}
         self.voice_blends: Dict[str, VoiceBlend] = {}
         self.gender_detector = GenderDetector()
+        # Compiled name patterns, built on first lookup
+        self._mention_patterns: Dict[str, re.Pattern] = {}
 
         self.load_configurations()
     
@@ -264,20 +287,9 @@ class CharacterVoiceMapper:
         
         # Simple pattern-based detection for new characters
         # Look for dialogue attribution patterns
-        patterns = [
-            r'"[^"]+"\s*,?\s*(\w+)\s+said',
-            r'(\w+)\s+said\s*,?\s*"[^"]+"',
-            r'"[^"]+"\s*,?\s*asked\s+(\w+)',
-            r'(\w+)\s+asked\s*,?\s*"[^"]+"',
-            r'(\w+)\s+replied',
-            r'(\w+)\s+whispered',
-            r'(\w+)\s+shouted',
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                name = match.group(1).strip()
+        for pattern in self.ATTRIBUTION_PATTERNS:
+            for match in pattern.finditer(text):
+                name = match.group('name').strip()
                 # Filter out common words
                 if self._is_likely_character_name(name):
                     detected.add(name.capitalize())
@@ -286,31 +298,18 @@ class CharacterVoiceMapper:
     
     def _character_mentioned(self, char_name: str, text: str) -> bool:
         """Check if character is mentioned in text."""
-        # Look for name in various contexts
-        patterns = [
-            r'\b' + re.escape(char_name) + r'\b',
-            r'\b' + re.escape(char_name.lower()) + r'\b',
-            r'\b' + re.escape(char_name.upper()) + r'\b'
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        
-        return False
+        # Case variants are all covered by IGNORECASE, so one pattern per name suffices
+        pattern = self._mention_patterns.get(char_name)
+        if pattern is None:
+            pattern = re.compile(r'\b' + re.escape(char_name) + r'\b', re.IGNORECASE)
+            self._mention_patterns[char_name] = pattern
+
+        return pattern.search(text) is not None
     
     def _is_likely_character_name(self, name: str) -> bool:
         """Determine if a word is likely a character name."""
-        # Filter out common words that aren't names
-        common_words = {
-            'he', 'she', 'they', 'it', 'i', 'you', 'we', 'us', 'them',
-            'said', 'asked', 'replied', 'told', 'spoke', 'answered',
-            'the', 'and', 'but', 'or', 'so', 'for', 'nor', 'yet',
-            'a', 'an', 'this', 'that', 'these', 'those'
-        }
-        
         # Basic checks
-        if name.lower() in common_words:
+        if name.lower() in self.COMMON_WORDS:
             return False
         
         if len(name) < 2:
@@ -349,8 +348,8 @@ class CharacterVoiceMapper:
                 voice_engine = KokoroEngine()
             except:
                 # Fallback to basic assignment using configured default
-                from ..config import ConfigManager
-                config = ConfigManager().config
+                from ..config import get_config_manager
+                config = get_config_manager().config
                 fallback_voice = config.tts.voice or "bm_fable"
                 return {name: fallback_voice for name in character_names}
 
@@ -418,8 +417,8 @@ class CharacterVoiceMapper:
         
         # Default narration voice
         # Use configured fallback voice
-        from ..config import ConfigManager
-        config = ConfigManager().config
+        from ..config import get_config_manager
+        config = get_config_manager().config
         return config.tts.voice or "bm_fable"  # Use configured voice or default
     
     def analyze_text_for_voices(self, text: str) -> Dict[str, any]:
@@ -390,6 +390,7 @@ class VoicePreviewGenerator:
         Returns:
             Number of files removed
         """
+        import os
         import time
         
         if not preview_dir.exists():
@@ -398,13 +399,17 @@ class VoicePreviewGenerator:
         cutoff_time = time.time() - (older_than_hours * 3600)
         removed_count = 0
         
-        for file_path in preview_dir.glob("preview_*.wav"):
-            try:
-                if file_path.stat().st_mtime < cutoff_time:
-                    file_path.unlink()
-                    removed_count += 1
-            except Exception:
-                pass  # Ignore errors during cleanup
+        # One directory pass; names are filtered before any stat() call
+        with os.scandir(preview_dir) as entries:
+            for entry in entries:
+                if not (entry.name.startswith("preview_") and entry.name.endswith(".wav")):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        removed_count += 1
+                except Exception:
+                    pass  # Ignore errors during cleanup
         
         return removed_count
 
@@ -0,0 +1,11 @@
+"""Tests for structural chapter detection in ChapterManager."""
+from reader.chapters.chapter_manager import ChapterManager
+
+
+def test_detect_chapters_by_structure_groups_sections():
+    section = " ".join(["word"] * 900)
+    text = "\n\n".join([section, "  " + section + "  ", "", section])
+    chapters = ChapterManager()._detect_chapters_by_structure(text)
+    assert [c.title for c in chapters] == ["Chapter 1", "Chapter 2"]
+    assert chapters[0].text_content == section + "\n\n" + section
+    assert chapters[1].text_content == section
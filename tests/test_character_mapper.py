@@ -0,0 +1,22 @@
+"""Tests for character detection in CharacterVoiceMapper."""
+from reader.voices.character_mapper import CharacterVoiceMapper
+
+
+def test_character_mentioned_ignores_case_and_partial_words(tmp_path):
+    mapper = CharacterVoiceMapper(tmp_path / "config")
+    assert mapper._character_mentioned("Alice", "ALICE ran home")
+    assert mapper._character_mentioned("Alice", "then alice left")
+    assert not mapper._character_mentioned("Al", "Alice waved")
+
+
+def test_is_likely_character_name_filters_common_words(tmp_path):
+    mapper = CharacterVoiceMapper(tmp_path / "config")
+    assert mapper._is_likely_character_name("Alice")
+    assert not mapper._is_likely_character_name("She")
+    assert not mapper._is_likely_character_name("alice")
+
+
+def test_detect_characters_in_text_uses_attribution(tmp_path):
+    mapper = CharacterVoiceMapper(tmp_path / "config")
+    text = '"Hello," Alice said. Bob replied quietly. "Why?" asked Carol. He whispered.'
+    assert mapper.detect_characters_in_text(text) == {'Alice', 'Bob', 'Carol'}
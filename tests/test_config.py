@@ -1,7 +1,7 @@
 """Tests for configuration management."""
 import pytest
 from pathlib import Path
-from reader.config import ConfigManager, TTSConfig, AudioConfig, ProcessingConfig, AppConfig
+from reader.config import ConfigManager, TTSConfig, AudioConfig, ProcessingConfig, AppConfig, get_config_manager
 
 
 @pytest.fixture
@@ -115,3 +115,13 @@ def test_directory_paths(config_manager):
     assert isinstance(text_dir, Path)
     assert isinstance(audio_dir, Path)
     assert isinstance(config_dir, Path)
+
+
+def test_get_config_manager_is_shared(tmp_path, monkeypatch):
+    """Test the user config singleton is loaded once and reused."""
+    import reader.config
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(reader.config, "_user_config_manager", None)
+    first = get_config_manager()
+    assert get_config_manager() is first
+    assert first.config_path.is_relative_to(tmp_path)
@@ -0,0 +1,57 @@
+"""Tests for DialogueDetector context analysis."""
+from reader.analysis.dialogue_detector import DialogueDetector, _detect_emotion_context
+
+
+def test_emotion_keywords_follow_priority_order():
+    dd = DialogueDetector()
+    # 'nervous' (fear) appears before 'furious' (anger) but anger has priority
+    assert dd._detect_emotion_context("She was nervous and furious") == 'anger'
+    assert dd._detect_emotion_context("He felt worried") == 'fear'
+    assert dd._detect_emotion_context("The room was quiet") == 'neutral'
+
+
+def test_emotion_punctuation_takes_precedence():
+    dd = DialogueDetector()
+    assert dd._detect_emotion_context("Stop it!") == 'anger'
+    assert dd._detect_emotion_context("Really?") == 'curiosity'
+
+
+def test_find_dialogue_skips_plain_narrative():
+    dd = DialogueDetector()
+    assert dd._find_dialogue("The house stood empty for years") == []
+    matches = dd._find_dialogue('"Come in," John said.')
+    assert matches[0][0] == 'Come in,'
+
+
+def test_classify_narrative_scores_categories():
+    dd = DialogueDetector()
+    assert dd._classify_narrative("He ran and grabbed the rope, then turned") == 'action'
+    assert dd._classify_narrative("She wondered and remembered") == 'internal_thought'
+    assert dd._classify_narrative("Nothing of note") == 'description'
+
+
+def test_context_helpers_are_memoized():
+    import gc
+    import weakref
+    dd = DialogueDetector()
+    _detect_emotion_context.cache_clear()
+    dd._detect_emotion_context("Yes.")
+    DialogueDetector()._detect_emotion_context("Yes.")
+    assert _detect_emotion_context.cache_info().hits == 1
+
+    # No reference cycle: the detector is freed without the cyclic GC
+    ref = weakref.ref(dd)
+    gc.disable()
+    try:
+        del dd
+        assert ref() is None
+    finally:
+        gc.enable()
+
+
+def test_get_statistics_reports_speakers():
+    dd = DialogueDetector()
+    segments = dd.analyze_text('"Come in," John said.\n\n"Thanks," Mary replied.')
+    stats = dd.get_statistics(segments)
+    assert stats['speakers'] == ['John', 'Mary']
+    assert stats['unique_speakers'] == 2
@@ -117,3 +117,27 @@ def test_kokoro_model_constants():
     assert KOKORO_MODEL_VERSION in KOKORO_MODEL_URL
     assert KOKORO_MODEL_FILE.endswith('.onnx')
     assert KOKORO_VOICES_FILE.endswith('.bin')
+
+
+def test_kokoro_sanitize_text():
+    """Test unicode punctuation and whitespace are normalized in one pass."""
+    engine = KokoroEngine.__new__(KokoroEngine)
+    text = "“Wait…” she said —  it’s\tfine"
+    assert engine._sanitize_text(text) == "\"Wait...\" she said - it's fine"
+    assert engine._sanitize_text("\x00\n") == "."
+
+
+def test_kokoro_streaming_synthesis_writes_one_wav(monkeypatch):
+    """Test long-text chunks are appended to a single WAV in order."""
+    import io
+    import wave
+    engine = KokoroEngine.__new__(KokoroEngine)
+    engine.kokoro = Mock()
+    engine.kokoro.create.side_effect = lambda text, **kwargs: (text.encode() * 2, 24000)
+    monkeypatch.setattr(KokoroEngine, '_samples_to_pcm', staticmethod(lambda samples: samples))
+
+    audio = engine._synthesize_chunks_streaming(["ab", " ", "cd"], {'af_sarah': 1.0}, 1.0)
+
+    with wave.open(io.BytesIO(audio), 'rb') as wav_file:
+        assert wav_file.getframerate() == 24000
+        assert wav_file.readframes(wav_file.getnframes()) == b"ababcdcd"
@@ -0,0 +1,453 @@
+"""Tests for FFmpegAudioProcessor command construction (subprocess mocked)."""
+import json
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from reader.processors import ffmpeg_processor
+from reader.processors.ffmpeg_processor import FFmpegAudioProcessor
+
+
+LOUDNORM_STDERR = """size=N/A time=00:00:01.50
+[Parsed_loudnorm_0 @ 0x1]
+{
+	"input_i" : "-27.61",
+	"input_tp" : "-4.47",
+	"input_lra" : "3.20",
+	"input_thresh" : "-37.70",
+	"target_offset" : "0.37"
+}
+"""
+
+
+class FakeRun:
+    """Stand-in for subprocess.run that records commands and fakes ffprobe."""
+
+    def __init__(self, streams=None):
+        self.commands = []
+        self.streams = streams or {}
+        self.encoders = ''
+        self.loudnorm = LOUDNORM_STDERR
+
+    def __call__(self, cmd, **kwargs):
+        self.commands.append(list(cmd))
+        if cmd[0] == 'ffprobe':
+            stream = self.streams.get(cmd[-1])
+            payload = {'streams': [stream] if stream else [], 'format': {'duration': '1.5'}}
+            return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(payload), stderr='')
+        if cmd[-1] == '-encoders':
+            return subprocess.CompletedProcess(cmd, 0, stdout=self.encoders, stderr='')
+        if cmd[-3:] == ['-f', 'null', '-']:
+            return subprocess.CompletedProcess(cmd, 0, stdout='', stderr=self.loudnorm)
+        return subprocess.CompletedProcess(cmd, 0, stdout='', stderr='')
+
+    def ffmpeg_commands(self):
+        return [c for c in self.commands
+                if c[0] != 'ffprobe' and '-version' not in c and '-encoders' not in c]
+
+    def version_checks(self):
+        return [c for c in self.commands if '-version' in c]
+
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    fake = FakeRun()
+    monkeypatch.setattr(ffmpeg_processor.subprocess, 'run', fake)
+    ffmpeg_processor._ffmpeg_available.cache_clear()
+    ffmpeg_processor._probe_file.cache_clear()
+    ffmpeg_processor._aac_encoder.cache_clear()
+    return fake
+
+
+MP3_STREAM = {'codec_type': 'audio', 'codec_name': 'mp3', 'sample_rate': '24000', 'channels': 1}
+
+
+def test_merge_stream_copies_homogeneous_inputs(tmp_path, fake_run):
+    inputs = [tmp_path / "a.m4a", tmp_path / "b.m4a"]
+    for path in inputs:
+        path.write_bytes(b"data")
+    aac = {'codec_type': 'audio', 'codec_name': 'aac', 'sample_rate': '24000', 'channels': 1}
+    fake_run.streams = {str(p): aac for p in inputs}
+    FFmpegAudioProcessor().merge_audio_files(inputs, tmp_path / "out.m4a")
+    cmd = fake_run.ffmpeg_commands()[-1]
+    assert cmd[cmd.index('-c') + 1] == 'copy'
+    assert '-b:a' not in cmd
+
+
+def test_merge_concatenates_mp3_frames_without_ffmpeg(tmp_path, fake_run):
+    from mutagen.id3 import ID3, TIT2
+    inputs = [tmp_path / "a.mp3", tmp_path / "b.mp3"]
+    for path, frames in zip(inputs, [b"\xff\xfbAAAA", b"\xff\xfbBBBB"]):
+        path.write_bytes(frames)
+        tags = ID3()
+        tags.add(TIT2(encoding=3, text=path.stem))
+        tags.save(str(path))
+    fake_run.streams = {str(p): dict(MP3_STREAM, bit_rate='128000') for p in inputs}
+    output = tmp_path / "out.mp3"
+    FFmpegAudioProcessor().merge_audio_files(inputs, output)
+    assert output.read_bytes() == b"\xff\xfbAAAA\xff\xfbBBBB"
+    assert fake_run.ffmpeg_commands() == []
+
+
+def mp3_frame(payload=b'', marker=b''):
+    """One 417-byte MPEG-1 Layer III frame: 128 kbps, 44.1 kHz, mono."""
+    frame = b'\xff\xfb\x90\xc0' + bytes(17) + marker + payload
+    return frame + bytes(417 - len(frame))
+
+
+def test_merge_mp3_drops_info_frames_and_tail_tags(tmp_path, fake_run):
+    ape_footer = b'APETAGEX' + (2000).to_bytes(4, 'little') + (40).to_bytes(4, 'little') + bytes(16)
+    inputs = [tmp_path / "a.mp3", tmp_path / "b.mp3"]
+    for path, audio in zip(inputs, [mp3_frame(b'A'), mp3_frame(b'B')]):
+        tail = bytes(8) + ape_footer + b'TAG' + bytes(125)
+        path.write_bytes(mp3_frame(marker=b'Info') + audio + tail)
+    fake_run.streams = {str(p): dict(MP3_STREAM, bit_rate='128000') for p in inputs}
+    output = tmp_path / "out.mp3"
+    FFmpegAudioProcessor().merge_audio_files(inputs, output)
+    assert output.read_bytes() == mp3_frame(b'A') + mp3_frame(b'B')
+    assert fake_run.ffmpeg_commands() == []
+
+
+def test_merge_vbr_mp3_falls_back_to_concat_demuxer(tmp_path, fake_run):
+    inputs = [tmp_path / "a.mp3", tmp_path / "b.mp3"]
+    for path in inputs:
+        path.write_bytes(mp3_frame(marker=b'Xing') + mp3_frame(b'A'))
+    # ffprobe reports each VBR file's average bitrate, which rarely match
+    for path, bit_rate in zip(inputs, ['118000', '131000']):
+        fake_run.streams[str(path)] = dict(MP3_STREAM, bit_rate=bit_rate)
+    FFmpegAudioProcessor().merge_audio_files(inputs, tmp_path / "out.mp3")
+    cmd = fake_run.ffmpeg_commands()[-1]
+    assert cmd[cmd.index('-f') + 1] == 'concat' and cmd[cmd.index('-c') + 1] == 'copy'
+
+
+def test_merge_mp3_with_different_bitrates_uses_concat_demuxer(tmp_path, fake_run):
+    inputs = [tmp_path / "a.mp3", tmp_path / "b.mp3"]
+    for path, bit_rate in zip(inputs, ['128000', '64000']):
+        path.write_bytes(mp3_frame(b'A'))
+        fake_run.streams[str(path)] = dict(MP3_STREAM, bit_rate=bit_rate)
+    FFmpegAudioProcessor().merge_audio_files(inputs, tmp_path / "out.mp3")
+    cmd = fake_run.ffmpeg_commands()[-1]
+    assert cmd[cmd.index('-f') + 1] == 'concat' and cmd[cmd.index('-c') + 1] == 'copy'
+
+
+def test_merge_reencodes_mixed_inputs(tmp_path, fake_run):
+    inputs = [tmp_path / "a.mp3", tmp_path / "b.wav"]
+    FFmpegAudioProcessor().merge_audio_files(inputs, tmp_path / "out.m4b")
+    cmd = fake_run.ffmpeg_commands()[-1]
+    assert cmd[cmd.index('-c:a') + 1] == 'aac'
+    assert 'copy' not in cmd
+
+
+def test_convert_format_batch_runs_every_job(tmp_path, fake_run):
+    jobs = [(tmp_path / f"{n}.wav", tmp_path / f"{n}.flac", 'flac') for n in range(3)]
+    FFmpegAudioProcessor().convert_format_batch(jobs, max_workers=2)
+    outputs = sorted(cmd[-1] for cmd in fake_run.ffmpeg_commands())
+    assert outputs == sorted(str(out) for _, out, _ in jobs)
+
+
+def test_batches_share_one_pool_and_respect_max_workers():
+    import threading
+    import time
+    from reader.processors.ffmpeg_processor import _shared_executor
+    lock = threading.Lock()
+    active = [0, 0]  # current, peak
+
+    def operation(_):
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+
+    pool = _shared_executor()
+    for _ in range(2):
+        FFmpegAudioProcessor._run_batch(operation, [(n,) for n in range(8)], max_workers=2)
+    assert _shared_executor() is pool
+    assert active[1] <= 2
+
+
+def test_batch_stops_submitting_after_a_failure():
+    started = []
+
+    def operation(n):
+        started.append(n)
+        raise RuntimeError(f"job {n} failed")
+
+    with pytest.raises(RuntimeError, match="job 0"):
+        FFmpegAudioProcessor._run_batch(operation, [(n,) for n in range(5)], max_workers=1)
+    assert started == [0]
+
+
+def test_batch_waits_for_running_jobs_before_raising():
+    import threading
+    import time
+    second_started = threading.Event()
+    finished = []
+
+    def operation(n):
+        if n == 0:
+            second_started.wait(5)
+            raise RuntimeError("job 0 failed")
+        second_started.set()
+        time.sleep(0.1)
+        finished.append(n)
+
+    with pytest.raises(RuntimeError, match="job 0"):
+        FFmpegAudioProcessor._run_batch(operation, [(0,), (1,)], max_workers=2)
+    assert finished == [1]
+
+
+def test_nested_batch_runs_inline_on_pool_threads():
+    import threading
+    threads = []
+
+    def inner(_):
+        threads.append(threading.current_thread())
+
+    def outer(_):
+        FFmpegAudioProcessor._run_batch(inner, [(0,), (1,)], max_workers=2)
+
+    FFmpegAudioProcessor._run_batch(outer, [(0,)], max_workers=1)
+    assert len(threads) == 2 and threads[0] is threads[1]
+    assert threads[0].name.startswith("ffmpeg")
+
+
+def test_normalize_audio_uses_two_pass_loudnorm(tmp_path, fake_run):
+    source = tmp_path / "in.wav"
+    source.write_bytes(b"data")
+    processor = FFmpegAudioProcessor()
+    processor.normalize_audio(source, tmp_path / "out.m4a")
+    processor.normalize_audio(source, tmp_path / "out2.m4a", target_lufs=-18.0)
+
+    commands = fake_run.ffmpeg_commands()
+    assert sum(cmd[-3:] == ['-f', 'null', '-'] for cmd in commands) == 1  # measured once
+    apply = commands[-1]
+    loudnorm = apply[apply.index('-af') + 1]
+    assert loudnorm.startswith('loudnorm=I=-18.0:')
+    assert 'measured_I=-27.61' in loudnorm and loudnorm.endswith(':offset=0.37:linear=true')
+    assert apply[1:5] == ['-nostdin', '-hide_banner', '-loglevel', 'error']
+    assert apply[-1] == str(tmp_path / "out2.m4a")
+
+
+def test_normalize_silent_input_falls_back_to_single_pass(tmp_path, fake_run):
+    fake_run.loudnorm = LOUDNORM_STDERR.replace('"-27.61"', '"-inf"').replace('"-37.70"', '"-inf"')
+    source = tmp_path / "in.wav"
+    source.write_bytes(b"data")
+    FFmpegAudioProcessor().normalize_audio(source, tmp_path / "out.m4a")
+    apply = fake_run.ffmpeg_commands()[-1]
+    assert apply[apply.index('-af') + 1] == 'loudnorm=I=-23.0:TP=-2.0:LRA=7.0'
+
+
+def test_convert_format_remuxes_matching_codec(tmp_path, fake_run):
+    source = tmp_path / "book.m4a"
+    source.write_bytes(b"data")
+    fake_run.streams = {str(source): {'codec_type': 'audio', 'codec_name': 'aac', 'channels': 1}}
+    FFmpegAudioProcessor().convert_format(source, tmp_path / "book.m4b", 'm4b')
+    cmd = fake_run.ffmpeg_commands()[-1]
+    assert cmd[cmd.index('-c:a') + 1] == 'copy'
+    assert '-b:a' not in cmd
+
+
+def test_convert_format_reencodes_other_codecs(tmp_path, fake_run):
+    source = tmp_path / "book.wav"
+    fake_run.streams = {str(source): {'codec_type': 'audio', 'codec_name': 'pcm_s16le', 'channels': 1}}
+    FFmpegAudioProcessor().convert_format(source, tmp_path / "book.m4b", 'm4b')
+    cmd = fake_run.ffmpeg_commands()[-1]
+    assert cmd[cmd.index('-c:a') + 1] == 'aac'
+
+
+def test_get_audio_info_probes_unchanged_file_once(tmp_path, fake_run):
+    source = tmp_path / "book.mp3"
+    source.write_bytes(b"data")
+    fake_run.streams = {str(source): MP3_STREAM}
+    processor = FFmpegAudioProcessor()
+    first = processor.get_audio_info(source)
+    second = processor.get_audio_info(source)
+    assert first['duration_seconds'] == second['duration_seconds'] == 1.5
+    assert first['sample_rate'] == 24000 and first['channels'] == 1
+    assert sum(cmd[0] == 'ffprobe' for cmd in fake_run.commands) == 1
+
+
+def test_ffmpeg_check_runs_once_per_process(fake_run):
+    FFmpegAudioProcessor()
+    FFmpegAudioProcessor()
+    assert len(fake_run.version_checks()) == 1
+
+
+def test_add_silence_builds_streaming_filter(tmp_path, fake_run):
+    FFmpegAudioProcessor().add_silence(tmp_path / "in.wav", tmp_path / "out.m4a", 1.5, 2.0)
+    cmd = fake_run.ffmpeg_commands()[-1]
+    assert cmd[cmd.index('-af') + 1] == 'adelay=1500:all=1,apad=pad_dur=2.0'
+
+
+def test_export_parameters_lookup(fake_run, monkeypatch):
+    import reader.config
+    audio = SimpleNamespace(bitrate='64k')
+    monkeypatch.setattr(reader.config, 'get_config_manager',
+                        lambda: SimpleNamespace(config=SimpleNamespace(audio=audio)))
+    processor = FFmpegAudioProcessor()
+    assert processor._get_export_parameters('MP3') == {'parameters': ('-ac', '1'), 'bitrate': '64k'}
+    assert processor._get_export_parameters('m4b')['codec'] == 'aac'
+    assert processor._get_export_parameters('xyz') == {}
+
+
+def test_aac_encoder_prefers_hardware_encoder(tmp_path, fake_run):
+    fake_run.encoders = (" A....D aac                  AAC (Advanced Audio Coding)\n"
+                         " A..... aac_at               aac (AudioToolbox) (codec aac)\n")
+    processor = FFmpegAudioProcessor()
+    assert processor._get_export_parameters('m4b')['codec'] == 'aac_at'
+    processor._get_export_parameters('m4a')
+    assert sum(cmd[-1] == '-encoders' for cmd in fake_run.commands) == 1
+
+
+def test_mp3_chapters_use_millisecond_offsets(fake_run):
+    from mutagen.id3 import ID3
+    tags = ID3()
+    chapters = [{'title': 'Intro', 'start_time': 0, 'end_time': 12.5}, {'start_time': 12.5}]
+    FFmpegAudioProcessor()._add_mp3_chapters(tags, chapters)
+    chaps = sorted(tags.getall('CHAP'), key=lambda c: c.start_time)
+    assert [(c.element_id, c.start_time, c.end_time) for c in chaps] == [
+        ('chp0', 0, 12500), ('chp1', 12500, 72500)]
+    assert str(chaps[1].sub_frames['TIT2']) == 'Chapter 2'
+    assert tags.getall('CTOC')[0].child_element_ids == ['chp0', 'chp1']
+
+
+def test_file_metadata_is_reread_after_retagging(tmp_path, fake_run):
+    from mutagen.id3 import ID3, TIT2
+    ffmpeg_processor._read_metadata.cache_clear()
+    path = tmp_path / "book.mp3"
+    tags = ID3()
+    tags.add(TIT2(encoding=3, text="First"))
+    tags.save(str(path))
+    processor = FFmpegAudioProcessor()
+    assert processor._get_file_metadata(path)['title'] == 'First'
+    assert processor._get_file_metadata(path)['title'] == 'First'
+    assert ffmpeg_processor._read_metadata.cache_info().hits == 1
+
+    tags.add(TIT2(encoding=3, text="A much longer second title"))
+    tags.save(str(path))
+    assert processor._get_file_metadata(path)['title'] == 'A much longer second title'
+
+
+def test_mutagen_is_imported_on_first_use():
+    import sys
+    code = ("import sys; from reader.processors import ffmpeg_processor as fp; "
+            "print('mutagen' in sys.modules, fp.AUDIO_LIBS_AVAILABLE)")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False True"
+
+
+def test_merge_places_per_file_chapters_on_merged_timeline(tmp_path, fake_run):
+    from mutagen.id3 import ID3
+    inputs = [tmp_path / "a.mp3", tmp_path / "b.mp3"]
+    for path in inputs:
+        path.write_bytes(b"\xff\xfbDATA")
+    fake_run.streams = {str(p): dict(MP3_STREAM, bit_rate='128000') for p in inputs}
+    chapters = [{'title': 'One', 'start_time': 0, 'file_index': 0},
+                {'title': 'Two', 'start_time': 0.5, 'end_time': 1.0, 'file_index': 1},
+                {'title': 'Three', 'start_time': 1.0, 'file_index': 1}]
+    output = tmp_path / "out.mp3"
+    FFmpegAudioProcessor().merge_audio_files(inputs, output, chapters)
+    chaps = sorted(ID3(str(output)).getall('CHAP'), key=lambda c: c.start_time)
+    # Each input probes as 1.5s long
+    # Missing ends run to the next chapter, or to the end of the merged file
+    assert [(c.start_time, c.end_time) for c in chaps] == [(0, 2000), (2000, 2500), (2500, 3000)]
+
+
+def test_process_pipeline_runs_one_encode(tmp_path, fake_run):
+    source = tmp_path / "book.wav"
+    source.write_bytes(b"data")
+    FFmpegAudioProcessor().process_pipeline(
+        source, tmp_path / "book.m4b", title="Title", author="Author",
+        chapters=[{'title': 'One', 'start_time': 0}])
+    encodes = [c for c in fake_run.ffmpeg_commands() if c[-3:] != ['-f', 'null', '-']]
+    assert len(encodes) == 1
+    cmd = encodes[0]
+    assert cmd[cmd.index('-af') + 1].endswith(':linear=true')
+    assert cmd[cmd.index('-map_chapters') + 1] == '1'
+    assert cmd[cmd.index('-c:a') + 1] == 'aac'
+    assert cmd.count('+faststart') == 1
+
+
+def test_process_pipeline_remux_adds_faststart_once(tmp_path, fake_run):
+    source = tmp_path / "book.m4a"
+    source.write_bytes(b"data")
+    fake_run.streams = {str(source): {'codec_type': 'audio', 'codec_name': 'aac', 'channels': 1}}
+    FFmpegAudioProcessor().process_pipeline(source, tmp_path / "book.m4b", normalize=False)
+    cmd = fake_run.ffmpeg_commands()[-1]
+    assert cmd[cmd.index('-c:a') + 1] == 'copy'
+    assert cmd.count('+faststart') == 1
+
+
+def test_ffmetadata_escapes_values_and_closes_chapters():
+    text = FFmpegAudioProcessor._ffmetadata(
+        {'title': 'A=B; #1'}, [{'start_time': 0}, {'title': 'Two', 'start_time': 2.5}], 4.0)
+    assert text.splitlines() == [
+        ';FFMETADATA1', 'title=A\\=B\\; \\#1',
+        '[CHAPTER]', 'TIMEBASE=1/1000', 'START=0', 'END=2500', 'title=Chapter 1',
+        '[CHAPTER]', 'TIMEBASE=1/1000', 'START=2500', 'END=4000', 'title=Two',
+    ]
+
+
+def test_add_silence_splices_wav_without_ffmpeg(tmp_path, fake_run):
+    import wave
+    source = tmp_path / "in.wav"
+    with wave.open(str(source), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(1000)
+        wav.writeframes(b"\x01\x00" * 10)
+    output = tmp_path / "out.wav"
+    FFmpegAudioProcessor().add_silence(source, output, 0.005, 0.002)
+    with wave.open(str(output), 'rb') as wav:
+        assert wav.readframes(wav.getnframes()) == bytes(10) + b"\x01\x00" * 10 + bytes(4)
+    assert fake_run.ffmpeg_commands() == []
+
+
+def test_add_silence_pads_8bit_wav_with_unsigned_silence(tmp_path, fake_run):
+    import wave
+    source = tmp_path / "in.wav"
+    with wave.open(str(source), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(1)
+        wav.setframerate(1000)
+        wav.writeframes(b"\x90" * 10)
+    output = tmp_path / "out.wav"
+    FFmpegAudioProcessor().add_silence(source, output, 0.005, 0.002)
+    with wave.open(str(output), 'rb') as wav:
+        assert wav.readframes(wav.getnframes()) == b"\x80" * 5 + b"\x90" * 10 + b"\x80" * 2
+
+
+def test_basic_processor_copies_same_format(tmp_path):
+    from reader.processors.ffmpeg_processor import BasicAudioProcessor
+    source = tmp_path / "in.mp3"
+    source.write_bytes(bytes(range(256)) * 1000)
+    output = tmp_path / "out" / "book.mp3"
+    BasicAudioProcessor().convert_format(source, output, 'mp3')
+    assert output.read_bytes() == source.read_bytes()
+    assert output.stat().st_mtime_ns == source.stat().st_mtime_ns
+
+
+def test_basic_processor_refuses_to_copy_onto_itself(tmp_path):
+    import shutil
+    from reader.processors.ffmpeg_processor import BasicAudioProcessor
+    source = tmp_path / "book.mp3"
+    source.write_bytes(bytes(1000))
+    with pytest.raises(shutil.SameFileError):
+        BasicAudioProcessor().convert_format(source, source, 'mp3')
+    assert source.stat().st_size == 1000
+
+
+def test_inputs_are_probed_once_across_operations(tmp_path, fake_run):
+    source = tmp_path / "book.m4a"
+    source.write_bytes(b"data")
+    fake_run.streams = {str(source): {'codec_type': 'audio', 'codec_name': 'aac', 'channels': 1}}
+    processor = FFmpegAudioProcessor()
+    processor.convert_format(source, tmp_path / "book.m4b", 'm4b')
+    processor.get_audio_info(source)
+    processor.merge_audio_files([source, source], tmp_path / "merged.m4b")
+    assert processor._offset_chapters([source, source], [{'start_time': 0, 'file_index': 1}]) == [
+        {'start_time': 1.5, 'end_time': 3.0, 'file_index': 1}]
+    assert sum(cmd[0] == 'ffprobe' for cmd in fake_run.commands) == 1
@@ -0,0 +1,16 @@
+"""Tests for pronoun-based gender detection."""
+from reader.analysis.gender_detector import GenderDetector
+
+
+def test_detect_multiple_genders_masks_other_names():
+    text = ("Alice walked home. She said she was tired. Alice smiled as she sat. "
+            "Bob opened the door. He said he laughed. Bob said he was hungry.")
+    genders = GenderDetector(context_window=40).detect_multiple_genders(['Alice', 'Bob'], text)
+    assert genders == {'Alice': 'female', 'Bob': 'male'}
+
+
+def test_detect_multiple_genders_prefers_longer_names():
+    text = "Ann Marie left. She ran, she hid. Ann Marie said she was late."
+    genders = GenderDetector(context_window=40).detect_multiple_genders(['Ann', 'Ann Marie'], text)
+    assert genders['Ann Marie'] == 'female'
+    assert genders['Ann'] == 'unknown'
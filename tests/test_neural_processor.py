@@ -0,0 +1,285 @@
+"""Tests for NeuralProcessor chunk synthesis helpers."""
+import io
+import json
+import wave
+
+import pytest
+
+from reader.analysis.dialogue_detector import DialogueDetector
+from reader.batch.neural_processor import NeuralProcessor
+from reader.voices.character_mapper import CharacterVoice, CharacterVoiceMapper
+
+
+class FakeEngine:
+    """Records synthesize calls and returns a fixed payload."""
+
+    def __init__(self):
+        self.calls = []
+
+    def synthesize(self, text, voice, speed, is_phonemes=False):
+        self.calls.append((text, voice))
+        return b'audio'
+
+
+class WavEngine:
+    """Returns one 16-bit sample per character; fails on long text."""
+
+    def __init__(self, max_len=1000):
+        self.max_len = max_len
+
+    def synthesize(self, text, voice, speed, is_phonemes=False):
+        if len(text) > self.max_len:
+            raise RuntimeError("index 510 is out of bounds")
+        return NeuralProcessor._pcm_to_wav(b'\x01\x00' * len(text))
+
+
+def read_frames(wav_data):
+    with wave.open(io.BytesIO(wav_data), 'rb') as wav_file:
+        return wav_file.readframes(wav_file.getnframes())
+
+
+def make_processor(tmp_path, **kwargs):
+    return NeuralProcessor(tmp_path / "out.mp3", progress_style="simple", **kwargs)
+
+
+def test_character_voices_use_default_spec_for_narration(tmp_path):
+    mapper = CharacterVoiceMapper(tmp_path / "config")
+    mapper.characters['John'] = CharacterVoice('John', 'am_adam', 'male')
+    processor = make_processor(tmp_path, character_mapper=mapper, dialogue_detector=DialogueDetector())
+    processor._concatenate_audio_segments = lambda parts: b''.join(parts)
+    segments = DialogueDetector().analyze_text('"Come in," John said.')
+    engine = FakeEngine()
+
+    audio = processor._synthesize_with_character_voices(
+        segments, engine, {'af_sarah': 0.5, 'bm_fable': 0.5}, 1.0)
+
+    assert audio == b'audio' * len(engine.calls)
+    assert engine.calls[0] == ('Come in,', 'am_adam')
+    assert engine.calls[1:] == [('John said.', 'af_sarah:50,bm_fable:50')]
+
+
+def test_synthesize_in_pieces_keeps_every_piece(tmp_path):
+    processor = make_processor(tmp_path)
+    processor.use_g2p = False
+    text = "First one. Second one! Third one?"
+    audio, pieces = processor._synthesize_in_pieces(text, 0, 1, WavEngine(max_len=15), {'af_sarah': 1.0}, 1.0)
+    assert pieces == 3
+    # All three sentences are in the joined PCM, not just the first
+    assert audio == b'\x01\x00' * len("First one.Second one!Third one?")
+
+
+def test_unknown_voice_aborts_without_split_retries(tmp_path):
+    class BadVoiceEngine(FakeEngine):
+        def synthesize(self, text, voice, speed, is_phonemes=False):
+            self.calls.append((text, voice))
+            raise ValueError(f"Voice '{voice}' not found. Available voices: af_sarah")
+
+    processor = make_processor(tmp_path)
+    processor.use_g2p = False
+    engine = BadVoiceEngine()
+    with open(tmp_path / "out.raw", 'wb') as output:
+        with pytest.raises(RuntimeError, match="not found"):
+            processor._process_all_chunks(output, ["One. Two. Three."], engine,
+                                          {'zz_nobody': 1.0}, 1.0, 0, 1, tmp_path / "book.txt", "hash")
+    assert len(engine.calls) == 1
+
+
+def test_settings_hash_tracks_config_changes(tmp_path):
+    processor = make_processor(tmp_path)
+    first = processor._get_settings_hash({'voice': 'af_sarah', 'speed': 1.0})
+    assert first == processor._get_settings_hash({'speed': 1.0, 'voice': 'af_sarah'})
+    assert first != processor._get_settings_hash({'voice': 'af_sarah', 'speed': 1.2})
+    assert len(first) == 8
+
+
+def test_file_hash_detects_source_edits(tmp_path):
+    source = tmp_path / "book.txt"
+    source.write_bytes(b"a" * 300_000)
+    first = NeuralProcessor._get_file_hash(source)
+    assert first == NeuralProcessor._get_file_hash(source)
+    source.write_bytes(b"a" * 150_000 + b"b" + b"a" * 149_999)
+    assert NeuralProcessor._get_file_hash(source) != first
+    assert NeuralProcessor._get_file_hash(tmp_path / "missing.txt") == ''
+
+
+def test_checkpoint_discarded_when_source_changes(tmp_path):
+    source = tmp_path / "book.txt"
+    source.write_text("Once upon a time.")
+    processor = make_processor(tmp_path)
+    processor.file_stat = processor._get_file_stat(source)
+    processor.file_hash = processor._get_file_hash(source)
+    processor.temp_wav_path.write_bytes(bytes(100))
+    processor._save_checkpoint(source, 3, 10, 100, "settings")
+    assert processor._load_checkpoint(source, 10, "settings") == (3, 100)
+
+    source.write_text("Once upon a time, again.")
+    processor.file_stat = processor._get_file_stat(source)
+    assert processor._load_checkpoint(source, 10, "settings") == (0, 0)
+    assert not processor.checkpoint_path.exists()
+
+
+def test_unchanged_source_is_not_refingerprinted_on_resume(tmp_path, monkeypatch):
+    source = tmp_path / "book.txt"
+    source.write_text("Once upon a time.")
+    processor = make_processor(tmp_path)
+    processor.file_stat = processor._get_file_stat(source)
+    processor.file_hash = processor._get_file_hash(source)
+    processor.temp_wav_path.write_bytes(bytes(100))
+    processor._save_checkpoint(source, 3, 10, 100, "settings")
+
+    def unexpected(path):
+        raise AssertionError("source was re-read")
+
+    monkeypatch.setattr(NeuralProcessor, '_get_file_hash', staticmethod(unexpected))
+    processor.file_hash = ''
+    assert processor._load_checkpoint(source, 10, "settings") == (3, 100)
+    assert processor.file_hash
+
+
+def test_temp_audio_is_complete_before_mp3_conversion(tmp_path):
+    source = tmp_path / "book.txt"
+    text = " ".join(["Hello there."] * 60)
+    source.write_text(text)
+    processor = make_processor(tmp_path, final_output_dir=tmp_path / "done")
+    processor.use_g2p = False
+    seen = []
+    processor._convert_wav_to_mp3 = lambda: seen.append(processor.temp_wav_path.stat().st_size)
+
+    processor.process_chunks(source, [text], WavEngine(), {'af_sarah': 1.0}, 1.0, {})
+
+    # Every synthesized sample, including the held-back crossfade tail, is on disk
+    assert seen == [2 * len(text)]
+
+
+def test_unicode_punctuation_is_normalized_before_synthesis(tmp_path):
+    processor = make_processor(tmp_path)
+    processor.use_g2p = False
+    engine = FakeEngine()
+    processor._process_single_chunk("“Wait” — it’s late", 0, 1, engine, {'af_sarah': 1.0}, 1.0)
+    assert engine.calls == [('"Wait" - it\'s late', 'af_sarah')]
+
+
+def test_voice_spec_is_formatted_once_per_blend(tmp_path):
+    NeuralProcessor._voice_spec.cache_clear()
+    processor = make_processor(tmp_path)
+    processor.use_g2p = False
+    engine = FakeEngine()
+    blend = {'af_sarah': 0.6, 'bm_fable': 0.4}
+    for idx, text in enumerate(["One.", "Two."]):
+        processor._process_single_chunk(text, idx, 2, engine, blend, 1.0)
+
+    assert [voice for _, voice in engine.calls] == ['af_sarah:60,bm_fable:40'] * 2
+    assert NeuralProcessor._voice_spec.cache_info().misses == 1
+
+
+def test_chapter_break_is_cached_true_silence(tmp_path):
+    processor = make_processor(tmp_path, pause_between_chapters=0.5)
+    audio = processor._process_single_chunk("   ", 0, 1, FakeEngine(), {'af_sarah': 1.0}, 1.0)
+    assert read_frames(audio) == bytes(24000)
+    assert processor._process_single_chunk("", 0, 1, FakeEngine(), {'af_sarah': 1.0}, 1.0) is audio
+
+
+def test_checkpoints_are_written_by_background_writer(tmp_path):
+    source = tmp_path / "book.txt"
+    processor = make_processor(tmp_path)
+    processor._start_checkpoint_writer()
+    for chunk in range(1, 4):
+        processor._save_checkpoint(source, chunk, 10, chunk * 100, "settings")
+    processor._stop_checkpoint_writer()
+
+    assert json.loads(processor.checkpoint_path.read_text())['current_chunk'] == 3
+    assert processor._checkpoint_thread is None
+
+
+def test_completed_run_leaves_no_checkpoint(tmp_path):
+    source = tmp_path / "book.txt"
+    source.write_text("One. Two.")
+    processor = make_processor(tmp_path, checkpoint_interval=1, final_output_dir=tmp_path / "done")
+    processor.use_g2p = False
+    processor._convert_wav_to_mp3 = lambda: None
+
+    processor.process_chunks(source, ["One.", "Two."], WavEngine(), {'af_sarah': 1.0}, 1.0, {})
+
+    assert not processor.checkpoint_path.exists()
+    assert processor._checkpoint_thread is None
+
+
+def test_failed_checkpoint_write_keeps_previous_checkpoint(tmp_path, monkeypatch):
+    source = tmp_path / "book.txt"
+    processor = make_processor(tmp_path)
+    processor._save_checkpoint(source, 1, 10, 100, "settings")
+
+    def crash(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("reader.batch.neural_processor.os.fsync", crash)
+    processor._save_checkpoint(source, 2, 10, 200, "settings")
+
+    assert json.loads(processor.checkpoint_path.read_text())['current_chunk'] == 1
+
+
+def test_fallback_wav_wraps_streamed_pcm(tmp_path):
+    processor = make_processor(tmp_path)
+    pcm = bytes(range(256)) * 40
+    processor.temp_wav_path.write_bytes(pcm)
+    processor._fallback_save_as_wav()
+
+    assert processor.output_path == tmp_path / "out.wav"
+    assert processor.output_path.read_bytes() == NeuralProcessor._pcm_to_wav(pcm)
+    assert not processor.temp_wav_path.exists()
+
+
+def test_eta_uses_monotonic_clock(tmp_path, monkeypatch):
+    import reader.batch.neural_processor as neural_processor
+    clock = iter(range(0, 1000, 10))
+    monkeypatch.setattr(neural_processor.time, 'monotonic', lambda: next(clock))
+    processor = make_processor(tmp_path)
+    processor.use_g2p = False
+    updates = []
+    processor.progress_display.update = lambda *args: updates.append(args)
+
+    with open(tmp_path / "out.raw", 'wb') as output:
+        processor._process_all_chunks(output, ["One.", "Two.", "Three."], WavEngine(),
+                                      {'af_sarah': 1.0}, 1.0, 0, 3, tmp_path / "book.txt", "hash")
+
+    # start=0, chunk 1 checkpoint=10, chunk 2 ETA at 20s for 2 of 3 chunks done
+    assert updates[0] == (1, 3, 0, 0)
+    assert updates[1] == (2, 3, 20, 10.0)
+
+
+def test_progress_display_registry_falls_back_to_simple(monkeypatch, capsys):
+    import reader.batch.neural_processor as neural_processor
+    from reader.batch.neural_processor import SimpleProgressDisplay, create_progress_display
+    monkeypatch.setitem(neural_processor.PROGRESS_DISPLAYS, 'missing',
+                        ('.no_such_display', 'Display', 'Missing', False))
+    assert isinstance(create_progress_display('missing'), SimpleProgressDisplay)
+    assert isinstance(create_progress_display('bogus'), SimpleProgressDisplay)
+    assert "Missing not available" in capsys.readouterr().out
+
+
+def test_simple_progress_is_rate_limited(capsys):
+    from reader.batch.neural_processor import SimpleProgressDisplay
+    display = SimpleProgressDisplay()
+    for chunk in range(1, 101):
+        display.update(chunk, 100, 0.0, 0.0)
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("🧠 Chunk 1/100")
+    assert lines[-1].startswith("🧠 Chunk 100/100")
+    assert len(lines) < 100
+
+
+def test_timeseries_progress_redraws_are_rate_limited(monkeypatch, capsys):
+    from unittest.mock import Mock
+    import reader.batch.timeseries_progress as timeseries_progress
+    plot = Mock()
+    monkeypatch.setattr(timeseries_progress, 'PLOTEXT_AVAILABLE', True)
+    monkeypatch.setattr(timeseries_progress, 'plt', plot, raising=False)
+    monkeypatch.setattr(timeseries_progress.os, 'system', Mock(side_effect=AssertionError("spawned a shell")))
+    display = timeseries_progress.TimeseriesProgressDisplay()
+    display.start(100, "book.txt")
+    for chunk in range(1, 101):
+        display.update(chunk, 100, 0.0, 0.0)
+
+    # Only the final chunk lands outside the interval in a fast loop
+    assert plot.show.call_count == 1
+    assert "Progress: [" + "█" * 60 in capsys.readouterr().out
@@ -0,0 +1,13 @@
+"""Tests for number expansion."""
+from reader.text_processing.number_expander import get_number_expander
+
+
+def test_expand_numbers_converts_numeric_expressions():
+    expander = get_number_expander()
+    assert expander.expand_numbers("I have 5 apples") == "I have five apples"
+    assert expander.expand_numbers("the 21st day") == "the twenty-first day"
+
+
+def test_expand_numbers_returns_text_without_digits_unchanged():
+    text = "No numbers here, only words."
+    assert get_number_expander().expand_numbers(text) is text
@@ -0,0 +1,18 @@
+"""Tests for the top-level package exports."""
+import subprocess
+import sys
+
+
+def test_import_does_not_load_api():
+    code = "import sys, reader; print('reader.api' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_public_api_resolves_lazily():
+    import reader
+    from reader.api import Reader, convert, list_voices
+    assert reader.Reader is Reader
+    assert reader.convert is convert
+    assert reader.list_voices is list_voices
+    assert "Reader" in dir(reader)
@@ -79,6 +79,14 @@ def test_text_parser_basic_parsing(text_parser, tmp_path):
     assert result.metadata['title'] == 'test'
 
 
+def test_text_parser_normalizes_whitespace(text_parser, tmp_path):
+    """Test tabs and non-breaking spaces collapse to single spaces, keeping newlines."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("One\t\u00a0 two.\n\tThree.", encoding='utf-8')
+
+    assert text_parser.parse(test_file).content == "One two.\n Three."
+
+
 def test_text_parser_invalid_file(text_parser):
     """Test text parser with non-existent file."""
     with pytest.raises(Exception):
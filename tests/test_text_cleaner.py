@@ -0,0 +1,19 @@
+"""Tests for TextCleaner metadata removal."""
+from reader.text_processing.text_cleaner import TextCleaner
+
+
+def test_remove_metadata_drops_long_catalog_only():
+    cleaner = TextCleaner()
+    catalog = "Always Coming Home The Beginning Place " * 8
+    text = "Chapter One\n" + catalog + "\n'It's late,' she said."
+    cleaned = cleaner.clean(text)
+    assert "Always Coming Home" not in cleaned
+    assert "'It's late,' she said." in cleaned
+
+
+def test_remove_metadata_keeps_short_runs_and_drops_isbn():
+    cleaner = TextCleaner()
+    text = "ISBN 9780000000000\nThe Quiet Harbor Was Empty Tonight."
+    cleaned = cleaner.clean(text)
+    assert "ISBN" not in cleaned
+    assert "The Quiet Harbor Was Empty Tonight." in cleaned
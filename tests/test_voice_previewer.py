@@ -0,0 +1,18 @@
+"""Tests for VoicePreviewGenerator housekeeping."""
+import os
+import time
+
+from reader.voices.voice_previewer import VoicePreviewGenerator
+
+
+def test_cleanup_previews_removes_only_old_previews(tmp_path):
+    old_time = time.time() - 48 * 3600
+    for name in ["preview_old.wav", "keep_old.wav", "preview_old.txt"]:
+        path = tmp_path / name
+        path.write_bytes(b"")
+        os.utime(path, (old_time, old_time))
+    (tmp_path / "preview_new.wav").write_bytes(b"")
+
+    assert VoicePreviewGenerator().cleanup_previews(tmp_path) == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "keep_old.wav", "preview_new.wav", "preview_old.txt"]